@@ -0,0 +1,148 @@
+# Compra e Venda de Ações com até k transações em O(n log n)
+# A PD clássica guarda uma tabela (k + 1) × n; no caso5 (k = 2000, n = 100.000)
+# são 200 milhões de células. Aqui a série vira pares vale/pico (o lucro com
+# transações ilimitadas) e, enquanto houver mais pares que k, a operação de
+# MENOR perda é desfeita: descartar uma transação ou fundir duas vizinhas
+# atravessando a queda entre elas. Um heap escolhe a menor perda e uma lista
+# duplamente encadeada mantém a sequência: O(n log n), independente de k.
+#
+# Uso: python acoes_k_transacoes.py [caso.txt ...]
+
+import heapq
+import time
+
+from acoes import casos_da_linha_de_comando, ler_caso
+
+
+def pares_vale_pico(precos):
+    """
+    Transações do lucro ilimitado: (dia de compra, dia de venda) para cada
+    subida máxima (vale estrito seguido do pico seguinte).
+    """
+    pares = []
+    n = len(precos)
+    i = 0
+    while i < n - 1:
+        while i < n - 1 and precos[i] >= precos[i + 1]:
+            i += 1
+        vale = i
+        while i < n - 1 and precos[i] <= precos[i + 1]:
+            i += 1
+        if i > vale:
+            pares.append((vale, i))
+    return pares
+
+
+def acoes_k_transacoes(k, precos):
+    """
+    Maior lucro com no máximo k transações (k = -1: ilimitado).
+
+    Explicação:
+    - Com os m pares vale/pico, a sequência alterna
+        lucro_1, queda_1, lucro_2, queda_2, ..., lucro_m
+      (queda_i = pico_i − vale_{i+1} > 0) e todos os valores são positivos.
+    - Reduzir de m para m − 1 transações custa o MENOR elemento x:
+        lucro interno: a transação some e as quedas vizinhas viram uma só,
+                       queda_esq + queda_dir − x;
+        queda:         as transações vizinhas viram uma só,
+                       lucro_esq + lucro_dir − x (compra no vale da
+                       esquerda, venda no pico da direita);
+        lucro na ponta: a transação some junto com a queda ao lado.
+    - O elemento combinado continua do mesmo tipo e nunca fica menor que os
+      vizinhos que absorveu, e a troca equivale a uma transação "desfeita"
+      de quem a redução anterior fundiu — por isso o guloso sobre a menor
+      perda é exato.
+    - Heap com remoção preguiçosa (cada nó tem uma versão) e lista
+      duplamente encadeada: O(m log m) depois da varredura O(n).
+    - Devolve (lucro, [(dia_compra, dia_venda), ...]) em ordem de dia.
+    """
+    pares = pares_vale_pico(precos)
+    if k < 0 or len(pares) <= k:
+        return sum(precos[v] - precos[c] for c, v in pares), pares
+    if k == 0:
+        return 0, []
+
+    # Nós 2i (lucro do par i) e 2i + 1 (queda entre os pares i e i + 1).
+    tamanho = 2 * len(pares) - 1
+    valor = [0] * tamanho
+    compra = [0] * tamanho
+    venda = [0] * tamanho
+    for i, (c, v) in enumerate(pares):
+        valor[2 * i] = precos[v] - precos[c]
+        compra[2 * i], venda[2 * i] = c, v
+        if i + 1 < len(pares):
+            valor[2 * i + 1] = precos[v] - precos[pares[i + 1][0]]
+    eh_lucro = [no % 2 == 0 for no in range(tamanho)]
+    anterior = list(range(-1, tamanho - 1))
+    proximo = list(range(1, tamanho + 1))
+    proximo[-1] = -1
+    vivo = [True] * tamanho
+    versao = [0] * tamanho
+
+    heap = [(valor[no], no, 0) for no in range(tamanho)]
+    heapq.heapify(heap)
+
+    def remover(no):
+        vivo[no] = False
+        if anterior[no] != -1:
+            proximo[anterior[no]] = proximo[no]
+        if proximo[no] != -1:
+            anterior[proximo[no]] = anterior[no]
+
+    transacoes = len(pares)
+    while transacoes > k:
+        x, no, v = heapq.heappop(heap)
+        if not vivo[no] or v != versao[no]:
+            continue
+
+        esquerda, direita = anterior[no], proximo[no]
+        if esquerda == -1 or direita == -1:
+            # Só um lucro pode estar na ponta: some junto com a queda ao lado.
+            remover(no)
+            remover(direita if esquerda == -1 else esquerda)
+        else:
+            valor[no] = valor[esquerda] + valor[direita] - x
+            eh_lucro[no] = not eh_lucro[no]
+            if eh_lucro[no]:
+                compra[no], venda[no] = compra[esquerda], venda[direita]
+            remover(esquerda)
+            remover(direita)
+            versao[no] += 1
+            heapq.heappush(heap, (valor[no], no, versao[no]))
+        transacoes -= 1
+
+    escolhidas = []
+    lucro = 0
+    for no in range(tamanho):
+        if vivo[no] and eh_lucro[no]:
+            escolhidas.append((compra[no], venda[no]))
+            lucro += valor[no]
+    escolhidas.sort()
+
+    return lucro, escolhidas
+
+
+def main():
+    print("Compra e Venda de Ações — k transações em O(n log n)\n")
+    print("=" * 60)
+
+    for caminho in casos_da_linha_de_comando():
+        k, precos = ler_caso(caminho)
+
+        inicio = time.perf_counter()
+        lucro, transacoes = acoes_k_transacoes(k, precos)
+        tempo_ms = (time.perf_counter() - inicio) * 1000
+
+        print(f"✓ {caminho}")
+        print(f"  k={'ilimitado' if k < 0 else k}, n={len(precos):,} dias, "
+              f"pares vale/pico={len(pares_vale_pico(precos)):,}")
+        print(f"  lucro={lucro:,} com {len(transacoes):,} transações")
+        print(f"  (compra, venda)={transacoes[:6]}{' ...' if len(transacoes) > 6 else ''}")
+        print(f"  tempo={tempo_ms:.2f} ms")
+        print()
+
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
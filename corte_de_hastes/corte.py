@@ -0,0 +1,112 @@
+# Funções comuns aos algoritmos de Corte de Hastes
+# Leitura dos casos de teste no formato escrito por
+# casos_teste/gerar_casos_corte_hastes.py:
+#
+#   comprimento
+#   m               (quantidade de tamanhos com preço)
+#   preço           (uma linha por tamanho: 1, 2, ..., m)
+#
+# Formato estendido (estoque limitado): a linha de um tamanho pode trazer
+# também a quantidade de pedaços desse tamanho que podem ser vendidos,
+# "preço quantidade". Sem a quantidade, o tamanho não tem limite.
+
+import os
+import sys
+
+DIR_CASOS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "casos_teste")
+
+
+def ler_caso(caminho):
+    """
+    Lê um arquivo de caso e devolve (comprimento, precos).
+
+    Explicação:
+    - precos[i] é o preço de um pedaço de tamanho i + 1.
+    - Quantidades do formato estendido são ignoradas (ver
+      ler_caso_com_estoque).
+    """
+    comprimento, precos, _ = ler_caso_com_estoque(caminho)
+    return comprimento, precos
+
+
+def ler_caso_com_estoque(caminho):
+    """
+    Lê um arquivo de caso e devolve (comprimento, precos, estoques).
+
+    Explicação:
+    - estoques[i] é quantos pedaços de tamanho i + 1 podem ser vendidos,
+      ou None quando a linha não traz quantidade (sem limite).
+    """
+    with open(caminho) as f:
+        comprimento = int(f.readline())
+        m = int(f.readline())
+        precos, estoques = [], []
+        for _ in range(m):
+            campos = f.readline().split()
+            precos.append(int(campos[0]))
+            estoques.append(int(campos[1]) if len(campos) > 1 else None)
+
+    return comprimento, precos, estoques
+
+
+def casos_da_linha_de_comando(dir_casos=DIR_CASOS):
+    """
+    Caminhos passados na linha de comando ou, se nenhum, todos os casos
+    de dir_casos (caso1.txt, caso2.txt, ...). Opções "--nome=valor"
+    são ignoradas aqui (ver opcao_da_linha_de_comando).
+    """
+    caminhos = [a for a in sys.argv[1:] if not a.startswith("--")]
+    if caminhos:
+        return caminhos
+
+    nomes = [n for n in os.listdir(dir_casos) if n.startswith("caso") and n.endswith(".txt")]
+    nomes.sort(key=lambda n: int(n[4:-4]))
+    return [os.path.join(dir_casos, n) for n in nomes]
+
+
+def opcao_da_linha_de_comando(nome, padrao):
+    """
+    Valor de "--nome=valor" na linha de comando, convertido para o tipo do
+    padrão; devolve o padrão se a opção não foi passada.
+    """
+    prefixo = f"--{nome}="
+    for argumento in sys.argv[1:]:
+        if argumento.startswith(prefixo):
+            return type(padrao)(argumento[len(prefixo):])
+    return padrao
+
+
+def corte_pd(limite, precos):
+    """
+    PD clássica do Corte de Hastes para todos os comprimentos 0..limite.
+
+    Explicação:
+    - dp[l] = max sobre i = 1..min(m, l) de precos[i-1] + dp[l - i].
+    - primeiro[l] guarda o tamanho do primeiro pedaço da melhor solução;
+      seguir primeiro[l], primeiro[l - primeiro[l]], ... dá os cortes.
+    - Tempo O(limite · m), memória O(limite).
+    """
+    m = len(precos)
+    dp = [0] * (limite + 1)
+    primeiro = [0] * (limite + 1)
+
+    for l in range(1, limite + 1):
+        melhor, escolha = -1, 0
+        for i in range(1, min(m, l) + 1):
+            valor = precos[i - 1] + dp[l - i]
+            if valor > melhor:
+                melhor, escolha = valor, i
+        dp[l] = melhor
+        primeiro[l] = escolha
+
+    return dp, primeiro
+
+
+def reconstruir_cortes(primeiro, comprimento):
+    """Cortes da solução ótima como {tamanho: quantidade}."""
+    cortes = {}
+    while comprimento > 0:
+        tamanho = primeiro[comprimento]
+        cortes[tamanho] = cortes.get(tamanho, 0) + 1
+        comprimento -= tamanho
+    return cortes
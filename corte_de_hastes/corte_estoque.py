@@ -0,0 +1,171 @@
+# Corte de Hastes com estoque limitado por tamanho
+# Cada tamanho i só pode ser vendido até q_i vezes (formato estendido de
+# corte.py: "preço quantidade"). Vira uma Mochila limitada: repetir o item
+# q_i vezes custaria O(L·Σq); com uma janela deslizante de máximos em cada
+# classe de resto (mod i) cada tamanho custa O(L), e O(L·m) no total.
+#
+# Uso: python corte_estoque.py [--estoque=0] [caso.txt ...]
+#      --estoque=N limita a N os tamanhos que o arquivo deixa sem limite.
+
+import time
+
+import numpy as np
+
+from corte import casos_da_linha_de_comando, ler_caso_com_estoque, opcao_da_linha_de_comando
+
+# "Menos infinito" das células de preenchimento: longe do limite do int64
+# para que somar ou subtrair k·preço nunca estoure.
+_MENOS_INFINITO = np.iinfo(np.int64).min // 4
+
+
+def aplicar_tamanho(linha, tamanho, preco, quantidade):
+    """
+    Aplica UM tamanho (até "quantidade" pedaços) sobre a linha da PD.
+
+    Explicação:
+    - nova[c] = max_{0 <= j <= q} linha[c − j·t] + j·p.
+    - Com c = r + k·t, a classe de resto r vira a sequência
+      g[k] = linha[r + k·t] − k·p, e nova[c] = k·p + max(g[k − q .. k]):
+      um máximo em janela de q + 1 posições.
+    - A linha é vista como matriz (K × t), uma coluna por classe de resto,
+      e as janelas de TODAS as classes são resolvidas juntas pelo método
+      de van Herk/Gil-Werman (a versão vetorizável da fila monotônica):
+      em blocos de q + 1 linhas, máximo da janela = max(sufixo do bloco
+      onde ela começa, prefixo do bloco onde ela termina).
+    - Tempo O(L) por tamanho, independente de q.
+    """
+    capacidade = len(linha) - 1
+    quantidade = min(quantidade, capacidade // tamanho)
+    if quantidade <= 0 or preco <= 0:
+        return linha
+
+    k_linhas = -(-(capacidade + 1) // tamanho)
+    g = np.full(k_linhas * tamanho, _MENOS_INFINITO, dtype=np.int64)
+    g[:capacidade + 1] = linha
+    g = g.reshape(k_linhas, tamanho)
+    ganho = np.arange(k_linhas, dtype=np.int64)[:, None] * preco
+    g -= ganho
+
+    janela = quantidade + 1
+    if janela >= k_linhas:
+        melhor = np.maximum.accumulate(g, axis=0)
+    else:
+        # q linhas de "menos infinito" no topo: a janela [k − q, k] vira [k, k + q].
+        blocos = -(-(k_linhas + quantidade) // janela)
+        h = np.full((blocos * janela, tamanho), _MENOS_INFINITO, dtype=np.int64)
+        h[quantidade:quantidade + k_linhas] = g
+        h = h.reshape(blocos, janela, tamanho)
+        prefixo = np.maximum.accumulate(h, axis=1).reshape(-1, tamanho)
+        sufixo = np.maximum.accumulate(h[:, ::-1], axis=1)[:, ::-1].reshape(-1, tamanho)
+        melhor = np.maximum(sufixo[:k_linhas], prefixo[quantidade:quantidade + k_linhas])
+
+    return (melhor + ganho).reshape(-1)[:capacidade + 1]
+
+
+def linha_pd(tamanhos, capacidade):
+    """
+    Melhor valor para cada comprimento 0..capacidade com os tamanhos dados.
+
+    Explicação:
+    - tamanhos: lista de (tamanho, preço, quantidade).
+    - linha[c] = maior valor com pedaços somando no máximo c (a sobra da
+      haste é descartada: com estoque limitado, nem todo comprimento pode
+      ser vendido inteiro).
+    """
+    linha = np.zeros(capacidade + 1, dtype=np.int64)
+    for tamanho, preco, quantidade in tamanhos:
+        linha = aplicar_tamanho(linha, tamanho, preco, quantidade)
+    return linha
+
+
+def _reconstruir(tamanhos, capacidade, cortes):
+    """
+    Divide os tamanhos ao meio e descobre quanto da haste cada metade usa
+    (mesma divisão e conquista de problema_mochila/mochila_pd_numpy.py).
+
+    Explicação:
+    - f, g = linha_pd de cada metade; a metade da esquerda fica com
+      c = argmax f[c] + g[capacidade − c].
+    - Com um único tamanho, o melhor é cortar o máximo de pedaços que cabe
+      no estoque e na capacidade.
+    - Memória O(L) viva por nível em vez da tabela m × L.
+    """
+    if not tamanhos:
+        return
+
+    if len(tamanhos) == 1:
+        tamanho, preco, quantidade = tamanhos[0]
+        copias = min(quantidade, capacidade // tamanho)
+        if copias > 0 and preco > 0:
+            cortes[tamanho] = copias
+        return
+
+    meio = len(tamanhos) // 2
+    esquerda, direita = tamanhos[:meio], tamanhos[meio:]
+
+    f = linha_pd(esquerda, capacidade)
+    g = linha_pd(direita, capacidade)
+    corte = int(np.argmax(f + g[::-1]))
+    del f, g
+
+    _reconstruir(esquerda, corte, cortes)
+    _reconstruir(direita, capacidade - corte, cortes)
+
+
+def corte_com_estoque(comprimento, precos, estoques):
+    """
+    Resolve o Corte de Hastes com estoque limitado por tamanho.
+
+    Explicação:
+    - estoques[i] é o limite de pedaços de tamanho i + 1 (None = sem limite,
+      o que equivale a comprimento // (i + 1)).
+    - Se o estoque inteiro soma menos que a haste, a PD só vai até essa
+      soma: o resto da haste nunca pode ser vendido.
+    - Devolve (valor_otimo, {tamanho: quantidade}).
+    """
+    tamanhos = []
+    total = 0
+    for i, (preco, estoque) in enumerate(zip(precos, estoques), 1):
+        quantidade = comprimento // i if estoque is None else min(estoque, comprimento // i)
+        if quantidade > 0 and preco > 0:
+            tamanhos.append((i, preco, quantidade))
+            total += quantidade * i
+    capacidade = min(comprimento, total)
+
+    valor_otimo = int(linha_pd(tamanhos, capacidade)[capacidade])
+
+    cortes = {}
+    _reconstruir(tamanhos, capacidade, cortes)
+
+    return valor_otimo, cortes
+
+
+def main():
+    estoque_padrao = opcao_da_linha_de_comando("estoque", 0)
+
+    print("Corte de Hastes — estoque limitado\n")
+    print("=" * 60)
+
+    for caminho in casos_da_linha_de_comando():
+        comprimento, precos, estoques = ler_caso_com_estoque(caminho)
+        if estoque_padrao:
+            estoques = [estoque_padrao if e is None else e for e in estoques]
+
+        inicio = time.perf_counter()
+        valor, cortes = corte_com_estoque(comprimento, precos, estoques)
+        tempo_ms = (time.perf_counter() - inicio) * 1000
+        usado = sum(t * q for t, q in cortes.items())
+
+        print(f"✓ {caminho}")
+        print(f"  comprimento={comprimento:,}, tamanhos={len(precos)}, "
+              f"limitados={sum(e is not None for e in estoques)}")
+        print(f"  valor ótimo={valor:,}, comprimento vendido={usado:,}")
+        print(f"  cortes={dict(sorted(cortes.items()))}")
+        print(f"  tempo={tempo_ms:.2f} ms")
+        print()
+
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+# Corte de Hastes para comprimentos muito maiores que a tabela de preços
+# O Corte de Hastes é uma mochila ilimitada. Seja b o tamanho de melhor razão
+# preço/tamanho: a partir de um limiar T <= b·m, toda solução ótima pode ser
+# escolhida contendo um pedaço de tamanho b, e então
+#     dp[L] = dp[L − b] + preço(b)     para L > T.
+# Basta calcular dp até T; qualquer comprimento é respondido em O(1), com
+# memória O(m²) em vez de O(L).
+#
+# Uso: python corte_periodico.py [caso.txt ...]
+
+import time
+
+from corte import casos_da_linha_de_comando, corte_pd, ler_caso, reconstruir_cortes
+
+
+def melhor_razao(precos):
+    """Menor tamanho entre os de maior preço/tamanho (menor limiar)."""
+    melhor = 1
+    for tamanho in range(2, len(precos) + 1):
+        # precos[t-1] / t > precos[b-1] / b, sem divisão em ponto flutuante
+        if precos[tamanho - 1] * melhor > precos[melhor - 1] * tamanho:
+            melhor = tamanho
+    return melhor
+
+
+class CortePeriodico:
+    """
+    Responde o Corte de Hastes para qualquer comprimento.
+
+    Explicação:
+    - Troca: entre quaisquer b pedaços de tamanho != b, algum subconjunto
+      soma um múltiplo de b (somas de prefixo módulo b). Esse subconjunto
+      pode virar cópias do pedaço b sem perder valor. Logo existe uma
+      solução ótima com menos de b pedaços diferentes de b, somando menos
+      de b·m de comprimento.
+    - Para L >= T = b·m, essa solução tem então pelo menos um pedaço b:
+      dp[L] = dp[L − b] + preço(b).
+    - dp e primeiro corte são calculados só até T (corte_pd). Um
+      comprimento L > T usa k = ceil((L − T) / b) cópias de b mais a
+      solução de L − k·b, que já está na tabela.
+    """
+
+    def __init__(self, precos):
+        self.precos = precos
+        self.melhor = melhor_razao(precos)
+        self.limiar = self.melhor * len(precos)
+        self._dp, self._primeiro = corte_pd(self.limiar, precos)
+
+    def _reduzir(self, comprimento):
+        if comprimento <= self.limiar:
+            return 0, comprimento
+        copias = -(-(comprimento - self.limiar) // self.melhor)
+        return copias, comprimento - copias * self.melhor
+
+    def valor(self, comprimento):
+        """Maior valor obtido cortando uma haste deste comprimento."""
+        copias, resto = self._reduzir(comprimento)
+        return copias * self.precos[self.melhor - 1] + self._dp[resto]
+
+    def cortes(self, comprimento):
+        """Cortes de uma solução ótima como {tamanho: quantidade}."""
+        copias, resto = self._reduzir(comprimento)
+        cortes = reconstruir_cortes(self._primeiro, resto)
+        if copias:
+            cortes[self.melhor] = cortes.get(self.melhor, 0) + copias
+        return cortes
+
+
+def main():
+    print("Corte de Hastes — solução periódica\n")
+    print("=" * 60)
+
+    for caminho in casos_da_linha_de_comando():
+        comprimento, precos = ler_caso(caminho)
+
+        inicio = time.perf_counter()
+        solucao = CortePeriodico(precos)
+        valor = solucao.valor(comprimento)
+        cortes = solucao.cortes(comprimento)
+        tempo_ms = (time.perf_counter() - inicio) * 1000
+
+        print(f"✓ {caminho}")
+        print(f"  comprimento={comprimento:,}, tamanhos com preço={len(precos)}")
+        print(f"  melhor razão: tamanho {solucao.melhor}, limiar T={solucao.limiar:,}")
+        print(f"  valor={valor:,}, cortes={dict(sorted(cortes.items()))}")
+        print(f"  tempo={tempo_ms:.2f} ms")
+        print()
+
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
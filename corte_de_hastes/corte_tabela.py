@@ -0,0 +1,192 @@
+# Tabela pré-calculada do Corte de Hastes para muitas consultas
+# Quando muitos comprimentos são consultados com a MESMA tabela de preços, vale
+# calcular uma vez dp[0..limite] e o primeiro corte de cada comprimento em
+# vetores compactos (int64 para o valor, uint16 para o corte) e responder cada
+# consulta com uma leitura e O(cortes) passos. A tabela vai para um arquivo
+# que outros processos abrem com mmap, sem recalcular 10^7 entradas.
+#
+# Uso: python corte_tabela.py [--tabela=arquivo.bin] [caso.txt ...]
+
+import mmap
+import struct
+import time
+
+import numpy as np
+
+from corte import casos_da_linha_de_comando, corte_pd, ler_caso, opcao_da_linha_de_comando
+from corte_periodico import melhor_razao
+
+# Cabeçalho: assinatura, limite, m, tamanho de melhor razão, limiar periódico.
+_CABECALHO = struct.Struct("<8sQQQQ")
+_ASSINATURA = b"CORTEDP1"
+
+
+class TabelaCorte:
+    """
+    dp e primeiro corte para todos os comprimentos 0..limite.
+
+    Explicação:
+    - Até o limiar T = b·m (b = tamanho de melhor razão) a PD clássica é
+      calculada normalmente (corte_pd).
+    - Acima de T vale dp[L] = dp[L − b] + preço(b) (ver corte_periodico.py),
+      então o resto da tabela é preenchido de uma vez com NumPy:
+      k = ceil((L − T) / b) cópias de b mais dp[L − k·b], e primeiro[L] = b.
+    - Os vetores são guardados como int64 ('q') e uint16 ('H'):
+      10^7 comprimentos ocupam ~100 MB, lidos direto do arquivo via mmap.
+    """
+
+    def __init__(self, precos, dp, primeiro, melhor, limiar, _mapa=None):
+        self.precos = precos
+        self._dp = dp
+        self._primeiro = primeiro
+        self.melhor = melhor
+        self.limiar = limiar
+        self._mapa = _mapa
+
+    @classmethod
+    def construir(cls, precos, limite):
+        """Calcula a tabela para os comprimentos 0..limite."""
+        if len(precos) > 0xFFFF:
+            raise ValueError("o primeiro corte é guardado em 16 bits (m <= 65535)")
+
+        melhor = melhor_razao(precos)
+        limiar = melhor * len(precos)
+        dp_pequena, primeiro_pequena = corte_pd(min(limite, limiar), precos)
+
+        dp = np.empty(limite + 1, dtype=np.int64)
+        primeiro = np.empty(limite + 1, dtype=np.uint16)
+        dp[:len(dp_pequena)] = dp_pequena
+        primeiro[:len(primeiro_pequena)] = primeiro_pequena
+
+        if limite > limiar:
+            comprimentos = np.arange(limiar + 1, limite + 1, dtype=np.int64)
+            copias = (comprimentos - limiar + melhor - 1) // melhor
+            dp[limiar + 1:] = copias * precos[melhor - 1] + dp[comprimentos - copias * melhor]
+            primeiro[limiar + 1:] = melhor
+
+        return cls(list(precos), dp, primeiro, melhor, limiar)
+
+    @property
+    def limite(self):
+        return len(self._dp) - 1
+
+    # ------------------------------------------------------------------
+    # Persistência
+    # ------------------------------------------------------------------
+
+    def salvar(self, caminho):
+        """Grava cabeçalho, preços, dp e primeiro corte em um arquivo."""
+        with open(caminho, "wb") as f:
+            f.write(_CABECALHO.pack(_ASSINATURA, self.limite, len(self.precos), self.melhor, self.limiar))
+            f.write(np.asarray(self.precos, dtype=np.int64).tobytes())
+            f.write(np.asarray(self._dp, dtype=np.int64).tobytes())
+            f.write(np.asarray(self._primeiro, dtype=np.uint16).tobytes())
+
+    @classmethod
+    def carregar(cls, caminho):
+        """
+        Abre uma tabela salva com mmap: dp e primeiro viram visões do
+        arquivo (sem cópia), carregadas sob demanda pelo sistema.
+        """
+        with open(caminho, "rb") as f:
+            mapa = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        assinatura, limite, m, melhor, limiar = _CABECALHO.unpack_from(mapa)
+        if assinatura != _ASSINATURA:
+            mapa.close()
+            raise ValueError(f"{caminho} não é uma tabela de Corte de Hastes")
+
+        visao = memoryview(mapa)
+        posicao = _CABECALHO.size
+        precos = visao[posicao:posicao + 8 * m].cast("q").tolist()
+        posicao += 8 * m
+        dp = visao[posicao:posicao + 8 * (limite + 1)].cast("q")
+        posicao += 8 * (limite + 1)
+        primeiro = visao[posicao:posicao + 2 * (limite + 1)].cast("H")
+
+        return cls(precos, dp, primeiro, melhor, limiar, _mapa=mapa)
+
+    def fechar(self):
+        """Libera o mmap de uma tabela aberta com carregar()."""
+        if self._mapa is not None:
+            self._dp.release()
+            self._primeiro.release()
+            self._mapa.close()
+            self._mapa = None
+
+    # ------------------------------------------------------------------
+    # Consultas
+    # ------------------------------------------------------------------
+
+    def valor(self, comprimento):
+        """Maior valor para uma haste deste comprimento (<= limite)."""
+        if not 0 <= comprimento <= self.limite:
+            raise ValueError(f"comprimento {comprimento} fora da tabela (0..{self.limite})")
+        return int(self._dp[comprimento])
+
+    def cortes(self, comprimento):
+        """
+        Cortes de uma solução ótima como {tamanho: quantidade}.
+
+        Explicação:
+        - Segue a cadeia de primeiros cortes: O(cortes) passos.
+        - Acima do limiar todos os primeiros cortes são b, então essa parte
+          da cadeia é contada de uma vez.
+        """
+        self.valor(comprimento)
+        cortes = {}
+        if comprimento > self.limiar:
+            copias = (comprimento - self.limiar + self.melhor - 1) // self.melhor
+            cortes[self.melhor] = copias
+            comprimento -= copias * self.melhor
+
+        primeiro = self._primeiro
+        while comprimento > 0:
+            tamanho = int(primeiro[comprimento])
+            cortes[tamanho] = cortes.get(tamanho, 0) + 1
+            comprimento -= tamanho
+        return cortes
+
+    def consultar_lote(self, comprimentos):
+        """[(valor, cortes)] para cada comprimento, na ordem dada."""
+        return [(self.valor(c), self.cortes(c)) for c in comprimentos]
+
+
+def main():
+    caminho_tabela = opcao_da_linha_de_comando("tabela", "")
+
+    print("Corte de Hastes — tabela pré-calculada\n")
+    print("=" * 60)
+
+    for caminho in casos_da_linha_de_comando():
+        comprimento, precos = ler_caso(caminho)
+
+        inicio = time.perf_counter()
+        tabela = TabelaCorte.construir(precos, comprimento)
+        tempo_construcao = (time.perf_counter() - inicio) * 1000
+
+        print(f"✓ {caminho}")
+        print(f"  tabela 0..{comprimento:,} construída em {tempo_construcao:.2f} ms")
+
+        if caminho_tabela:
+            tabela.salvar(caminho_tabela)
+            inicio = time.perf_counter()
+            tabela = TabelaCorte.carregar(caminho_tabela)
+            print(f"  salva em {caminho_tabela} e reaberta (mmap) em {(time.perf_counter() - inicio) * 1000:.2f} ms")
+
+        consultas = sorted({comprimento, comprimento // 2, comprimento // 3 + 1, 7 % (comprimento + 1)})
+        inicio = time.perf_counter()
+        respostas = tabela.consultar_lote(consultas)
+        tempo_consultas = (time.perf_counter() - inicio) * 1000
+
+        for c, (valor, cortes) in zip(consultas, respostas):
+            print(f"  L={c:,}: valor={valor:,}, cortes={dict(sorted(cortes.items()))}")
+        print(f"  {len(consultas)} consultas em {tempo_consultas:.3f} ms")
+        print()
+        tabela.fechar()
+
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+# Funções comuns aos algoritmos de Edição de Strings (Distância de Levenshtein)
+# Leitura dos casos de teste no formato escrito por casos_teste/gerar_casos_edicao.py:
+#
+#   str1
+#   str2
+
+import os
+import sys
+
+DIR_CASOS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "casos_teste")
+
+
+def ler_caso(caminho):
+    """
+    Lê um arquivo de caso e devolve (str1, str2).
+
+    Explicação:
+    - Cada string ocupa uma linha inteira.
+    - Apenas a quebra de linha final é removida: espaços fazem parte da
+      string.
+    """
+    with open(caminho) as f:
+        str1 = f.readline().rstrip("\n")
+        str2 = f.readline().rstrip("\n")
+
+    return str1, str2
+
+
+def casos_da_linha_de_comando(dir_casos=DIR_CASOS):
+    """
+    Caminhos passados na linha de comando ou, se nenhum, todos os casos
+    de dir_casos (caso1.txt, caso2.txt, ...). Opções "--nome=valor"
+    são ignoradas aqui (ver opcao_da_linha_de_comando).
+    """
+    caminhos = [a for a in sys.argv[1:] if not a.startswith("--")]
+    if caminhos:
+        return caminhos
+
+    nomes = [n for n in os.listdir(dir_casos) if n.startswith("caso") and n.endswith(".txt")]
+    nomes.sort(key=lambda n: int(n[4:-4]))
+    return [os.path.join(dir_casos, n) for n in nomes]
+
+
+def opcao_da_linha_de_comando(nome, padrao):
+    """
+    Valor de "--nome=valor" na linha de comando, convertido para o tipo do
+    padrão; devolve o padrão se a opção não foi passada.
+    """
+    prefixo = f"--{nome}="
+    for argumento in sys.argv[1:]:
+        if argumento.startswith(prefixo):
+            return type(padrao)(argumento[len(prefixo):])
+    return padrao
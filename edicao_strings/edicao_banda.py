@@ -0,0 +1,110 @@
+# Distância de Edição em banda (Ukkonen) com limite máximo
+# Se a distância é d, o caminho ótimo nunca sai das diagonais |i − j| <= d.
+# Basta então calcular uma faixa de 2k + 1 diagonais: O(k·n) em vez de O(m·n).
+# Como d não é conhecido, k começa pequeno e dobra até a faixa confirmar a
+# resposta — ou até passar do limite max_k pedido.
+#
+# Uso: python edicao_banda.py [--max_k=1000] [caso.txt ...]
+
+import time
+
+from edicao import casos_da_linha_de_comando, ler_caso, opcao_da_linha_de_comando
+
+
+def _distancia_na_banda(str1, str2, k):
+    """
+    Distância de edição restrita à faixa |i − j| <= k, ou None se > k.
+
+    Explicação:
+    - Cada linha guarda só 2k + 1 células: a posição t representa a coluna
+      j = i + t − k.
+    - Na linha anterior, a diagonal (i−1, j−1) está na mesma posição t e a
+      célula de cima (i−1, j) em t + 1; a da esquerda (i, j−1) está em t − 1
+      na linha atual.
+    - Valores fora da faixa contam como k + 1 ("infinito"): se a resposta
+      for <= k, ela é exata.
+    - Se todas as células de uma linha passam de k, nenhuma linha seguinte
+      pode voltar a <= k, e a função desiste ali mesmo.
+    """
+    m, n = len(str1), len(str2)
+    infinito = k + 1
+    largura = 2 * k + 1
+
+    anterior = [infinito] * largura
+    for t in range(k, min(largura, n + k + 1)):
+        anterior[t] = t - k
+
+    for i in range(1, m + 1):
+        atual = [infinito] * largura
+        c = str1[i - 1]
+        menor = infinito
+        for t in range(max(0, k - i), min(largura, n - i + k + 1)):
+            j = i + t - k
+            if j == 0:
+                melhor = i
+            else:
+                melhor = anterior[t] + (c != str2[j - 1])
+                if t + 1 < largura and anterior[t + 1] + 1 < melhor:
+                    melhor = anterior[t + 1] + 1
+                if t > 0 and atual[t - 1] + 1 < melhor:
+                    melhor = atual[t - 1] + 1
+            if melhor > infinito:
+                melhor = infinito
+            atual[t] = melhor
+            if melhor < menor:
+                menor = melhor
+        if menor > k:
+            return None
+        anterior = atual
+
+    resposta = anterior[n - m + k]
+    return resposta if resposta <= k else None
+
+
+def distancia_edicao(str1, str2, max_k):
+    """
+    Distância de Levenshtein se ela for <= max_k; None ("> max_k") senão.
+
+    Explicação:
+    - |m − n| é um limite inferior: se já passa de max_k, desiste sem
+      calcular nada.
+    - A faixa começa com k = max(1, |m − n|) e dobra (sem passar de max_k)
+      até _distancia_na_banda confirmar a resposta.
+    - Tempo total O(d·n) para distância d (a soma das faixas dobradas é no
+      máximo o dobro da última); memória O(d).
+    """
+    m, n = len(str1), len(str2)
+    if abs(m - n) > max_k:
+        return None
+
+    k = min(max_k, max(1, abs(m - n)))
+    while True:
+        resposta = _distancia_na_banda(str1, str2, k)
+        if resposta is not None or k >= max_k:
+            return resposta
+        k = min(max_k, 2 * k)
+
+
+def main():
+    max_k = opcao_da_linha_de_comando("max_k", 1000)
+
+    print(f"Distância de Edição — banda de Ukkonen (max_k = {max_k})\n")
+    print("=" * 60)
+
+    for caminho in casos_da_linha_de_comando():
+        str1, str2 = ler_caso(caminho)
+
+        inicio = time.perf_counter()
+        distancia = distancia_edicao(str1, str2, max_k)
+        tempo_ms = (time.perf_counter() - inicio) * 1000
+
+        print(f"✓ {caminho}")
+        print(f"  |str1|={len(str1):,}, |str2|={len(str2):,}")
+        print(f"  distância={distancia if distancia is not None else f'> {max_k}'}, {tempo_ms:.2f} ms")
+        print()
+
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# Distância de Edição bit-paralela (Myers 1999 / Hyyrö)
+# As diferenças verticais de uma coluna da PD (+1, 0 ou −1) cabem em dois
+# vetores de bits, Pv e Mv. Cada caractere do texto atualiza a coluna inteira
+# com ~15 operações de palavra. Em Python, cada vetor é um único inteiro de m
+# bits, o que faz o papel dos blocos de 64 bits de Hyyrö: as operações sobre
+# inteiros grandes já percorrem as palavras de máquina em C.
+#
+# Uso: python edicao_bits.py [caso.txt ...]
+
+import time
+
+from edicao import casos_da_linha_de_comando, ler_caso
+from edicao_pd import distancia_edicao_pd
+
+# Até este número de células a PD clássica também roda, para comparação.
+CELULAS_COMPARACAO = 1_000_000
+
+
+def distancia_edicao_bits(str1, str2):
+    """
+    Distância de Levenshtein em O(⌈m/w⌉·n) operações de palavra.
+
+    Explicação:
+    - O padrão (a string menor, com m caracteres) vira uma máscara por
+      caractere: Peq[c] tem o bit i ligado se padrao[i] == c. Memória
+      O(σ·m/w); nenhuma matriz é criada.
+    - Pv/Mv: bit i ligado se a coluna atual sobe/desce de 1 na linha i.
+    - Para cada caractere do texto calculamos as diferenças horizontais
+      Ph/Mh; o bit mais alto delas atualiza a distância na última linha.
+    - Ph é deslocado com 1 entrando por baixo, pois a primeira linha da PD
+      de edição (0, 1, 2, ...) cresce 1 a cada coluna.
+    - Resultado idêntico ao de distancia_edicao_pd.
+    """
+    if len(str1) < len(str2):
+        str1, str2 = str2, str1
+    texto, padrao = str1, str2
+    m = len(padrao)
+    if m == 0:
+        return len(texto)
+
+    peq = {}
+    for i, c in enumerate(padrao):
+        peq[c] = peq.get(c, 0) | (1 << i)
+
+    todos_uns = (1 << m) - 1
+    topo = 1 << (m - 1)
+    pv, mv = todos_uns, 0
+    distancia = m
+
+    for c in texto:
+        eq = peq.get(c, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | (~(xh | pv) & todos_uns)
+        mh = pv & xh
+
+        if ph & topo:
+            distancia += 1
+        elif mh & topo:
+            distancia -= 1
+
+        ph = ((ph << 1) | 1) & todos_uns
+        mh = (mh << 1) & todos_uns
+        pv = mh | (~(xv | ph) & todos_uns)
+        mv = ph & xv
+
+    return distancia
+
+
+def main():
+    print("Distância de Edição — bit-paralela (Myers / Hyyrö)\n")
+    print("=" * 60)
+
+    for caminho in casos_da_linha_de_comando():
+        str1, str2 = ler_caso(caminho)
+
+        inicio = time.perf_counter()
+        distancia = distancia_edicao_bits(str1, str2)
+        tempo_ms = (time.perf_counter() - inicio) * 1000
+
+        print(f"✓ {caminho}")
+        print(f"  |str1|={len(str1):,}, |str2|={len(str2):,}")
+        print(f"  distância={distancia:,}, {tempo_ms:.2f} ms")
+        if len(str1) * len(str2) <= CELULAS_COMPARACAO:
+            print(f"  PD clássica={distancia_edicao_pd(str1, str2):,}")
+        print()
+
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+# Distância de Edição por Programação Dinâmica clássica (tabela completa)
+# Referência O(m·n) em tempo e memória, usada para conferir os outros motores.
+
+
+def distancia_edicao_pd(str1, str2):
+    """
+    Distância de Levenshtein de str1 para str2.
+
+    Explicação:
+    - tabela[i][j] = distância entre str1[:i] e str2[:j].
+    - Bordas: tabela[i][0] = i (remoções) e tabela[0][j] = j (inserções).
+    - Cada célula é o menor entre remover (cima + 1), inserir
+      (esquerda + 1) e substituir/manter (diagonal + 0 ou 1).
+    """
+    m, n = len(str1), len(str2)
+    tabela = [[0] * (n + 1) for _ in range(m + 1)]
+    for i in range(m + 1):
+        tabela[i][0] = i
+    for j in range(n + 1):
+        tabela[0][j] = j
+
+    for i in range(1, m + 1):
+        for j in range(1, n + 1):
+            custo = 0 if str1[i - 1] == str2[j - 1] else 1
+            tabela[i][j] = min(
+                tabela[i - 1][j] + 1,
+                tabela[i][j - 1] + 1,
+                tabela[i - 1][j - 1] + custo,
+            )
+
+    return tabela[m][n]
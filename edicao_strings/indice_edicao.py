@@ -0,0 +1,322 @@
+# Índice de dicionário para busca aproximada por Distância de Edição
+# Comparar uma consulta com cada um dos 10^5–10^6 termos custa uma PD inteira
+# por termo. Em uma trie, termos com o mesmo prefixo compartilham as linhas da
+# PD desse prefixo, e um ramo inteiro é descartado assim que a menor célula da
+# linha passa do limite k.
+#
+# A trie é guardada em vetores planos (pré-ordem), o que permite salvar o
+# índice em um arquivo e reabri-lo com mmap, sem reconstruir nada.
+#
+# Uso: python indice_edicao.py [--dicionario=termos.txt] [--k=2] [--top=3]
+#                              [consulta ...]
+
+import mmap
+import os
+import random
+import struct
+import sys
+import time
+from array import array
+
+from edicao import DIR_CASOS, opcao_da_linha_de_comando
+
+# Cabeçalho do arquivo: assinatura, número de nós, número de termos, bytes do texto.
+_CABECALHO = struct.Struct("<8sQQQ")
+_ASSINATURA = b"TRIEDIT1"
+
+
+class IndiceEdicao:
+    """
+    Trie em pré-ordem para consultas "todos a distância <= k" e "N mais
+    próximos".
+
+    Explicação:
+    - Nó i: caractere[i] (código Unicode), fim[i] (primeiro nó depois da
+      subárvore de i) e termo[i] (índice do termo que termina em i, ou −1).
+      O nó 0 é a raiz.
+    - Os filhos de i são i + 1, fim[i + 1], fim[fim[i + 1]], ... até fim[i].
+    - Os termos ficam concatenados em UTF-8 (texto) com os deslocamentos
+      de cada um (inicios), também em vetores planos.
+    """
+
+    def __init__(self, caractere, fim, termo, inicios, texto, _mapa=None):
+        self._caractere = caractere
+        self._fim = fim
+        self._termo = termo
+        self._inicios = inicios
+        self._texto = texto
+        self._mapa = _mapa
+
+    @classmethod
+    def construir(cls, termos):
+        """
+        Constrói o índice de uma vez a partir de um iterável de termos.
+
+        Explicação:
+        - Os termos são ordenados e deduplicados; termos vizinhos
+          compartilham o maior prefixo comum (lcp).
+        - A cada termo fechamos os nós do caminho mais fundos que o lcp
+          (gravando fim) e abrimos um nó por caractere novo.
+        """
+        termos = sorted(set(termos))
+
+        caractere = array("I", [0])
+        fim = array("I", [0])
+        termo = array("i", [-1])
+        caminho = [0]  # nós abertos, da raiz até o último caractere do termo anterior
+        anterior = ""
+
+        for indice, palavra in enumerate(termos):
+            lcp = 0
+            limite = min(len(anterior), len(palavra))
+            while lcp < limite and anterior[lcp] == palavra[lcp]:
+                lcp += 1
+
+            while len(caminho) > lcp + 1:
+                fim[caminho.pop()] = len(caractere)
+
+            for c in palavra[lcp:]:
+                caminho.append(len(caractere))
+                caractere.append(ord(c))
+                fim.append(0)
+                termo.append(-1)
+            termo[caminho[-1]] = indice
+            anterior = palavra
+
+        while caminho:
+            fim[caminho.pop()] = len(caractere)
+
+        codificados = [p.encode("utf-8") for p in termos]
+        inicios = array("Q", [0])
+        for bruto in codificados:
+            inicios.append(inicios[-1] + len(bruto))
+
+        return cls(caractere, fim, termo, inicios, b"".join(codificados))
+
+    def __len__(self):
+        return len(self._inicios) - 1
+
+    def termo(self, indice):
+        """Termo de número "indice" (na ordem alfabética)."""
+        return bytes(self._texto[self._inicios[indice]:self._inicios[indice + 1]]).decode("utf-8")
+
+    # ------------------------------------------------------------------
+    # Persistência
+    # ------------------------------------------------------------------
+
+    def salvar(self, caminho):
+        """Grava cabeçalho, vetores da trie e texto dos termos em um arquivo."""
+        with open(caminho, "wb") as f:
+            f.write(_CABECALHO.pack(_ASSINATURA, len(self._caractere), len(self), len(self._texto)))
+            for vetor in (self._caractere, self._fim, self._termo, self._inicios):
+                f.write(vetor.tobytes() if isinstance(vetor, array) else bytes(vetor))
+            f.write(bytes(self._texto))
+
+    @classmethod
+    def carregar(cls, caminho):
+        """
+        Abre um índice salvo com mmap: os vetores viram visões do arquivo,
+        sem cópia nem reconstrução. O sistema operacional carrega as páginas
+        sob demanda e as compartilha entre processos.
+        """
+        with open(caminho, "rb") as f:
+            mapa = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        assinatura, nos, termos, bytes_texto = _CABECALHO.unpack_from(mapa)
+        if assinatura != _ASSINATURA:
+            mapa.close()
+            raise ValueError(f"{caminho} não é um índice de edição")
+
+        visao = memoryview(mapa)
+        posicao = _CABECALHO.size
+        vetores = []
+        for formato, quantidade in (("I", nos), ("I", nos), ("i", nos), ("Q", termos + 1)):
+            tamanho = quantidade * array(formato).itemsize
+            vetores.append(visao[posicao:posicao + tamanho].cast(formato))
+            posicao += tamanho
+        texto = visao[posicao:posicao + bytes_texto]
+
+        return cls(*vetores, texto, _mapa=mapa)
+
+    def __getstate__(self):
+        # pickle: copia os vetores (mesmo se vierem de um mmap).
+        return {
+            "caractere": array("I", self._caractere),
+            "fim": array("I", self._fim),
+            "termo": array("i", self._termo),
+            "inicios": array("Q", self._inicios),
+            "texto": bytes(self._texto),
+        }
+
+    def __setstate__(self, estado):
+        self.__init__(**estado)
+
+    # ------------------------------------------------------------------
+    # Consultas
+    # ------------------------------------------------------------------
+
+    def _percorrer(self, consulta, k, ao_encontrar):
+        """
+        Percorre a trie calculando uma linha da PD por nó.
+
+        Explicação:
+        - linha[j] = distância entre o prefixo do nó e consulta[:j]; a linha
+          do filho sai da linha do pai em O(len(consulta)).
+        - Se o nó termina um termo e linha[-1] <= k, chama ao_encontrar.
+        - Se min(linha) > k, nenhum termo da subárvore pode ficar <= k
+          (o mínimo da linha nunca diminui ao descer): a subárvore inteira,
+          até fim[i], é ignorada.
+        """
+        caractere, fim, termo = self._caractere, self._fim, self._termo
+        m = len(consulta)
+        raiz = list(range(m + 1))
+        if termo[0] >= 0 and m <= k:
+            ao_encontrar(termo[0], m)
+
+        pilha = [(filho, raiz) for filho in self._filhos(0)]
+        while pilha:
+            no, anterior = pilha.pop()
+
+            c = chr(caractere[no])
+            linha = [anterior[0] + 1]
+            for j in range(1, m + 1):
+                melhor = anterior[j - 1] + (consulta[j - 1] != c)
+                if anterior[j] + 1 < melhor:
+                    melhor = anterior[j] + 1
+                if linha[j - 1] + 1 < melhor:
+                    melhor = linha[j - 1] + 1
+                linha.append(melhor)
+
+            if termo[no] >= 0 and linha[m] <= k:
+                ao_encontrar(termo[no], linha[m])
+            if no + 1 < fim[no] and min(linha) <= k:
+                pilha.extend((filho, linha) for filho in self._filhos(no))
+
+    def _filhos(self, no):
+        filho, fim = no + 1, self._fim
+        while filho < fim[no]:
+            yield filho
+            filho = fim[filho]
+
+    def buscar(self, consulta, k):
+        """Todos os termos a distância <= k, como [(termo, distância)] ordenado."""
+        encontrados = []
+        self._percorrer(consulta, k, lambda t, d: encontrados.append((d, t)))
+        encontrados.sort()
+        return [(self.termo(t), d) for d, t in encontrados]
+
+    def mais_proximos(self, consulta, n):
+        """
+        Os n termos mais próximos, como [(termo, distância)] ordenado.
+
+        Explicação:
+        - Busca com k = 0, 1, 2, ... até juntar n termos. Cada busca com k
+          pequeno poda quase toda a trie, então repetir as de k menores sai
+          mais barato que uma única busca sem limite.
+        - Empates na distância saem em ordem alfabética.
+        """
+        n = min(n, len(self))
+        if n <= 0:
+            return []
+
+        k = 0
+        while True:
+            encontrados = self.buscar(consulta, k)
+            if len(encontrados) >= n:
+                return encontrados[:n]
+            k += 1
+
+    def buscar_lote(self, consultas, k=None, n=None):
+        """
+        Responde várias consultas de uma vez, na ordem de entrada.
+
+        Explicação:
+        - Com k: cada resposta é buscar(consulta, k); com n: mais_proximos.
+        - Consultas repetidas são calculadas uma única vez.
+        """
+        if (k is None) == (n is None):
+            raise ValueError("informe exatamente um entre k e n")
+
+        respostas = {}
+        resultado = []
+        for consulta in consultas:
+            if consulta not in respostas:
+                if k is not None:
+                    respostas[consulta] = self.buscar(consulta, k)
+                else:
+                    respostas[consulta] = self.mais_proximos(consulta, n)
+            resultado.append(respostas[consulta])
+        return resultado
+
+    def fechar(self):
+        """Libera o mmap de um índice aberto com carregar()."""
+        if self._mapa is not None:
+            for vetor in (self._caractere, self._fim, self._termo, self._inicios, self._texto):
+                vetor.release()
+            self._mapa.close()
+            self._mapa = None
+
+
+def _dicionario_padrao():
+    """
+    Dicionário de demonstração: as strings curtas dos casos de teste e
+    100.000 palavras pseudoaleatórias (semente fixa) de 4 a 10 letras.
+    """
+    termos = []
+    for nome in os.listdir(DIR_CASOS):
+        if nome.startswith("caso") and nome.endswith(".txt"):
+            with open(os.path.join(DIR_CASOS, nome)) as f:
+                termos.extend(linha.rstrip("\n") for linha in f if len(linha) <= 64)
+
+    gerador = random.Random(0)
+    letras = "abcdefghijklmnopqrstuvwxyz"
+    for _ in range(100000):
+        termos.append("".join(gerador.choice(letras) for _ in range(gerador.randint(4, 10))))
+    return termos
+
+
+def main():
+    k = opcao_da_linha_de_comando("k", 2)
+    top = opcao_da_linha_de_comando("top", 3)
+    caminho_dicionario = opcao_da_linha_de_comando("dicionario", "")
+    caminho_indice = opcao_da_linha_de_comando("indice", "")
+    consultas = [a for a in sys.argv[1:] if not a.startswith("--")] or ["helo", "satruday", "identicl"]
+
+    if caminho_dicionario:
+        with open(caminho_dicionario) as f:
+            termos = [linha.rstrip("\n") for linha in f]
+    else:
+        termos = _dicionario_padrao()
+
+    print("Índice de Distância de Edição — trie\n")
+    print("=" * 60)
+
+    inicio = time.perf_counter()
+    indice = IndiceEdicao.construir(termos)
+    print(f"✓ {len(indice):,} termos indexados em {(time.perf_counter() - inicio) * 1000:.2f} ms")
+
+    if caminho_indice:
+        indice.salvar(caminho_indice)
+        inicio = time.perf_counter()
+        indice = IndiceEdicao.carregar(caminho_indice)
+        print(f"✓ salvo em {caminho_indice} e reaberto (mmap) em {(time.perf_counter() - inicio) * 1000:.2f} ms")
+    print()
+
+    inicio = time.perf_counter()
+    respostas_k = indice.buscar_lote(consultas, k=k)
+    respostas_top = indice.buscar_lote(consultas, n=top)
+    tempo_ms = (time.perf_counter() - inicio) * 1000
+
+    for consulta, dentro, proximos in zip(consultas, respostas_k, respostas_top):
+        print(f"✓ '{consulta}'")
+        print(f"  distância <= {k}: {dentro[:8]}{' ...' if len(dentro) > 8 else ''}")
+        print(f"  {top} mais próximos: {proximos}")
+        print()
+
+    print(f"{2 * len(consultas)} consultas em {tempo_ms:.2f} ms")
+    indice.fechar()
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,241 @@
+# Processamento em lote de muitos pares (Distância de Edição ou LCS)
+# Lê um arquivo (ou a entrada padrão) com vários casos no mesmo formato de
+# duas linhas por par escrito por casos_teste/gerar_casos_edicao.py e devolve
+# os resultados na ordem de entrada, em fluxo.
+#
+# - Pares repetidos são resolvidos uma vez só (cache pelo hash do conteúdo).
+# - Os pares são ordenados por tamanho, para equilibrar a carga entre os
+#   processos, e os pequenos são agrupados em lotes vetorizados com NumPy.
+#
+# Uso: python lote_edicao.py [--problema=edicao|lcs] [--trabalhadores=N]
+#                            [--janela=10000] [--max_cache=100000] [arquivo ... | -]
+
+import hashlib
+import os
+import sys
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from edicao import casos_da_linha_de_comando, opcao_da_linha_de_comando
+from edicao_bits import distancia_edicao_bits
+
+# Pares com as duas strings até este tamanho entram nos lotes NumPy.
+TAMANHO_PEQUENO = 256
+
+# Limite de células (pares × colunas) de uma linha do lote NumPy.
+CELULAS_LOTE = 1 << 20
+
+# Entradas do cache LRU padrão de processar_lote.
+MAX_CACHE = 100000
+
+
+def ler_pares(arquivos):
+    """
+    Gera os pares (str1, str2) de cada arquivo, duas linhas por par.
+
+    Explicação:
+    - "-" lê da entrada padrão, o que permite encadear com outro processo.
+    - Os pares são lidos sob demanda: o arquivo nunca é carregado inteiro.
+    """
+    for caminho in arquivos:
+        f = sys.stdin if caminho == "-" else open(caminho)
+        try:
+            while True:
+                str1 = f.readline()
+                if not str1:
+                    break
+                str2 = f.readline()
+                yield str1.rstrip("\n"), str2.rstrip("\n")
+        finally:
+            if f is not sys.stdin:
+                f.close()
+
+
+def _lote_numpy(pares, problema):
+    """
+    Resolve vários pares pequenos de uma vez, uma linha da PD por passo.
+
+    Explicação:
+    - As strings viram matrizes de códigos com preenchimento (−1 e −2,
+      que nunca coincidem). A linha i da PD de TODOS os pares é uma matriz
+      (pares × colunas) calculada com poucas operações NumPy.
+    - A dependência da esquerda é resolvida com um acumulado:
+        edição: linha[j] = min_l (tmp[l] + j − l) → minimum.accumulate
+        LCS:    linha[j] = max_l tmp[l]            → maximum.accumulate
+    - O resultado de cada par é lido na linha i = len(str1), coluna
+      len(str2): o preenchimento à direita e abaixo não o afeta.
+    """
+    p = len(pares)
+    tam1 = np.array([len(a) for a, _ in pares])
+    tam2 = np.array([len(b) for _, b in pares])
+    m, n = int(tam1.max()), int(tam2.max())
+
+    codigos1 = np.full((p, m), -1, dtype=np.int64)
+    codigos2 = np.full((p, n), -2, dtype=np.int64)
+    for k, (a, b) in enumerate(pares):
+        codigos1[k, :len(a)] = [ord(c) for c in a]
+        codigos2[k, :len(b)] = [ord(c) for c in b]
+
+    colunas = np.arange(n + 1)
+    edicao = problema == "edicao"
+    linha = np.tile(colunas, (p, 1)) if edicao else np.zeros((p, n + 1), dtype=np.int64)
+    resultado = np.empty(p, dtype=np.int64)
+
+    por_linha = {}
+    for k, i in enumerate(tam1.tolist()):
+        por_linha.setdefault(i, []).append(k)
+
+    for i in range(m + 1):
+        if i > 0:
+            igual = codigos1[:, i - 1:i] == codigos2
+            tmp = np.empty_like(linha)
+            if edicao:
+                tmp[:, 0] = i
+                tmp[:, 1:] = np.minimum(linha[:, 1:] + 1, linha[:, :-1] + ~igual)
+                linha = np.minimum.accumulate(tmp - colunas, axis=1) + colunas
+            else:
+                tmp[:, 0] = 0
+                tmp[:, 1:] = np.maximum(linha[:, 1:], linha[:, :-1] + igual)
+                linha = np.maximum.accumulate(tmp, axis=1)
+
+        if i in por_linha:
+            selecionados = np.array(por_linha[i])
+            resultado[selecionados] = linha[selecionados, tam2[selecionados]]
+
+    return resultado.tolist()
+
+
+def _resolver_grupo(problema, pares):
+    """Unidade de trabalho de um processo: um lote NumPy ou um par grande."""
+    if len(pares) == 1 and problema == "edicao" and max(map(len, pares[0])) > TAMANHO_PEQUENO:
+        return [distancia_edicao_bits(*pares[0])]
+    return _lote_numpy(pares, problema)
+
+
+def _agrupar(pares):
+    """
+    Ordena os pares por tamanho e os divide em grupos de trabalho.
+
+    Explicação:
+    - Pares grandes formam um grupo sozinhos.
+    - Pares pequenos de tamanho parecido formam um lote até CELULAS_LOTE
+      células por linha; juntar tamanhos parecidos reduz o preenchimento.
+    - Devolve listas de posições (dentro de "pares").
+    """
+    ordem = sorted(range(len(pares)), key=lambda k: (max(map(len, pares[k])), len(pares[k][1])))
+
+    grupos, atual, colunas = [], [], 0
+    for k in ordem:
+        a, b = pares[k]
+        if max(len(a), len(b)) > TAMANHO_PEQUENO:
+            grupos.append([k])
+            continue
+        colunas = max(colunas, len(b) + 1)
+        if atual and (len(atual) + 1) * colunas > CELULAS_LOTE:
+            grupos.append(atual)
+            atual, colunas = [], len(b) + 1
+        atual.append(k)
+    if atual:
+        grupos.append(atual)
+
+    return grupos
+
+
+def processar_lote(pares, problema="edicao", trabalhadores=None, janela=10000, cache=None, max_cache=MAX_CACHE):
+    """
+    Gera os resultados de cada par, na ordem de entrada.
+
+    Explicação:
+    - A entrada é consumida em janelas de até "janela" pares: memória
+      limitada mesmo para fluxos longos.
+    - Em cada janela, os pares ainda não vistos (pelo hash BLAKE2 do
+      conteúdo) são agrupados e enviados ao pool; os repetidos vêm do cache.
+    - Sem "cache", os resultados ficam num LRU de até max_cache entradas:
+      a memória continua limitada mesmo com muitos pares distintos. Um
+      dicionário passado em "cache" é usado como está, sem remoções (para
+      quem quer um cache ilimitado ou compartilhado entre chamadas).
+    - Os resultados da janela saem em ordem assim que ela termina.
+    - Com trabalhadores=1 tudo roda no próprio processo.
+    """
+    trabalhadores = trabalhadores or os.cpu_count() or 1
+    lru = cache is None
+    cache = OrderedDict() if lru else cache
+    pool = ProcessPoolExecutor(trabalhadores) if trabalhadores > 1 else None
+
+    def chave(par):
+        a, b = par
+        return hashlib.blake2b(f"{problema}\0{a}\0{b}".encode("utf-8"), digest_size=16).digest()
+
+    try:
+        iterador = iter(pares)
+        while True:
+            bloco = []
+            for par in iterador:
+                bloco.append((chave(par), par))
+                if len(bloco) == janela:
+                    break
+            if not bloco:
+                return
+
+            # Resultados da janela à parte: o LRU pode descartar entradas
+            # antes de a janela inteira sair.
+            resultados = {}
+            novos = {}
+            for h, par in bloco:
+                if h in resultados or h in novos:
+                    continue
+                if h in cache:
+                    resultados[h] = cache[h]
+                    if lru:
+                        cache.move_to_end(h)
+                else:
+                    novos[h] = par
+            chaves = list(novos)
+            unicos = [novos[h] for h in chaves]
+
+            grupos = _agrupar(unicos)
+            lotes = [[unicos[k] for k in grupo] for grupo in grupos]
+            if pool is None:
+                respostas = [_resolver_grupo(problema, lote) for lote in lotes]
+            else:
+                respostas = pool.map(_resolver_grupo, [problema] * len(lotes), lotes)
+
+            for grupo, resposta in zip(grupos, respostas):
+                for k, valor in zip(grupo, resposta):
+                    resultados[chaves[k]] = valor
+                    cache[chaves[k]] = valor
+            if lru:
+                while len(cache) > max_cache:
+                    cache.popitem(last=False)
+
+            for h, _ in bloco:
+                yield resultados[h]
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+
+def main():
+    problema = opcao_da_linha_de_comando("problema", "edicao")
+    trabalhadores = opcao_da_linha_de_comando("trabalhadores", os.cpu_count() or 1)
+    janela = opcao_da_linha_de_comando("janela", 10000)
+    max_cache = opcao_da_linha_de_comando("max_cache", MAX_CACHE)
+    arquivos = casos_da_linha_de_comando()
+
+    print(f"Lote de pares — {problema}, trabalhadores={trabalhadores}\n", file=sys.stderr)
+
+    inicio = time.perf_counter()
+    total = 0
+    for valor in processar_lote(ler_pares(arquivos), problema, trabalhadores, janela, max_cache=max_cache):
+        print(valor)
+        total += 1
+    tempo = time.perf_counter() - inicio
+
+    print(f"\n✓ {total:,} pares em {tempo:.2f} s ({total / tempo:,.0f} pares/s)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
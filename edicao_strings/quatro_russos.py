@@ -0,0 +1,248 @@
+# Método dos Quatro Russos (Masek–Paterson) para Edição e LCS
+# Em alfabetos pequenos (as strings geradas usam "ABCD" ou "ABCDEFGH"), um
+# bloco t × t da tabela fica totalmente determinado pelas t letras de cada
+# string e pelas DIFERENÇAS entre células vizinhas nas bordas de cima e da
+# esquerda. Todos os blocos possíveis são calculados uma única vez e a tabela
+# é varrida bloco a bloco com uma consulta por bloco: O(m·n / t²) consultas.
+#
+# As tabelas pré-calculadas ficam em disco, uma por (problema, alfabeto, t).
+#
+# Uso: python quatro_russos.py [--problema=edicao|lcs] [--t=0] [caso.txt ...]
+
+import hashlib
+import os
+import time
+from array import array
+
+from edicao import DIR_CASOS, casos_da_linha_de_comando, ler_caso, opcao_da_linha_de_comando
+
+DIR_CACHE = os.path.join(os.path.expanduser("~"), ".cache", "quatro_russos")
+
+# Os casos de lcs usam o mesmo formato de duas linhas.
+DIR_CASOS_LCS = os.path.normpath(os.path.join(DIR_CASOS, "..", "..", "lcs", "casos_teste"))
+
+# Maior tabela aceita ao escolher t automaticamente (entradas).
+ENTRADAS_MAXIMAS = 1 << 20
+
+# Diferenças possíveis entre células vizinhas: edição {−1, 0, 1}, LCS {0, 1}.
+_BASE = {"edicao": 3, "lcs": 2}
+_MENOR_DIFERENCA = {"edicao": -1, "lcs": 0}
+
+
+def _bloco_direto(sub1, sub2, topo, esquerda, problema):
+    """
+    Calcula um bloco célula a célula, em valores relativos ao canto.
+
+    Explicação:
+    - topo: diferenças horizontais da linha de cima (len(sub2) valores).
+    - esquerda: diferenças verticais da coluna da esquerda (len(sub1)).
+    - Devolve (baixo, direita): as mesmas diferenças na linha de baixo e
+      na coluna da direita, que são as bordas dos blocos vizinhos.
+    - Serve para pré-calcular a tabela e para os blocos incompletos das
+      bordas, quando m ou n não são múltiplos de t.
+    """
+    linha = [0]
+    for h in topo:
+        linha.append(linha[-1] + h)
+
+    direita = []
+    for i, c in enumerate(sub1):
+        nova = [linha[0] + esquerda[i]]
+        for j, d in enumerate(sub2, 1):
+            if problema == "edicao":
+                nova.append(min(linha[j] + 1, nova[j - 1] + 1, linha[j - 1] + (c != d)))
+            elif c == d:
+                nova.append(linha[j - 1] + 1)
+            else:
+                nova.append(max(linha[j], nova[j - 1]))
+        direita.append(nova[-1] - linha[-1])
+        linha = nova
+
+    baixo = [linha[j] - linha[j - 1] for j in range(1, len(linha))]
+    return baixo, direita
+
+
+def _codificar(diferencas, problema):
+    base, menor = _BASE[problema], _MENOR_DIFERENCA[problema]
+    codigo = 0
+    for d in reversed(diferencas):
+        codigo = codigo * base + (d - menor)
+    return codigo
+
+
+def _decodificar(codigo, tamanho, problema):
+    base, menor = _BASE[problema], _MENOR_DIFERENCA[problema]
+    diferencas = []
+    for _ in range(tamanho):
+        codigo, digito = divmod(codigo, base)
+        diferencas.append(digito + menor)
+    return diferencas
+
+
+def _calcular_tabela(alfabeto, t, problema):
+    """
+    Resultado de todos os blocos t × t possíveis.
+
+    Explicação:
+    - Entrada do bloco: t letras de cada string (σ^t cada) e as bordas
+      de cima e da esquerda (K^t cada, K = 3 na edição e 2 na LCS).
+    - Índice = ((letras1 · σ^t + letras2) · K^t + topo) · K^t + esquerda.
+    - Valor = baixo · K^t + direita.
+    """
+    sigma_t = len(alfabeto) ** t
+    k_t = _BASE[problema] ** t
+
+    palavras = []
+    for codigo in range(sigma_t):
+        letras = []
+        for _ in range(t):
+            codigo, s = divmod(codigo, len(alfabeto))
+            letras.append(alfabeto[s])
+        palavras.append("".join(letras))
+    bordas = [_decodificar(codigo, t, problema) for codigo in range(k_t)]
+
+    tabela = array("I")
+    for sub1 in palavras:
+        for sub2 in palavras:
+            for topo in bordas:
+                for esquerda in bordas:
+                    baixo, direita = _bloco_direto(sub1, sub2, topo, esquerda, problema)
+                    tabela.append(_codificar(baixo, problema) * k_t + _codificar(direita, problema))
+    return tabela
+
+
+def carregar_tabela(alfabeto, t, problema, dir_cache=DIR_CACHE):
+    """
+    Tabela de blocos do disco; se não existir, calcula e grava.
+
+    Explicação:
+    - O arquivo é identificado pelo problema, por t e por um hash do
+      alfabeto: execuções seguintes pulam o pré-cálculo.
+    """
+    assinatura = hashlib.sha1("".join(alfabeto).encode("utf-8")).hexdigest()[:16]
+    caminho = os.path.join(dir_cache, f"{problema}_t{t}_{assinatura}.bin")
+
+    if os.path.exists(caminho):
+        tabela = array("I")
+        with open(caminho, "rb") as f:
+            tabela.frombytes(f.read())
+        return tabela
+
+    tabela = _calcular_tabela(alfabeto, t, problema)
+    os.makedirs(dir_cache, exist_ok=True)
+    temporario = f"{caminho}.{os.getpid()}.tmp"
+    with open(temporario, "wb") as f:
+        tabela.tofile(f)
+    os.replace(temporario, caminho)
+    return tabela
+
+
+def escolher_t(tamanho_alfabeto, problema, celulas):
+    """
+    Maior t (>= 1) cuja tabela cabe em ENTRADAS_MAXIMAS e não passa do
+    número de células da tabela da PD (pré-calcular mais blocos do que
+    células existem não compensa).
+    """
+    limite = min(ENTRADAS_MAXIMAS, celulas)
+    t = 1
+    while (tamanho_alfabeto * _BASE[problema]) ** (2 * (t + 1)) <= limite:
+        t += 1
+    return t
+
+
+def quatro_russos(str1, str2, problema="edicao", t=None, dir_cache=DIR_CACHE):
+    """
+    Distância de edição (ou comprimento da LCS) varrendo blocos t × t.
+
+    Explicação:
+    - As strings são cortadas em pedaços de t letras; cada pedaço completo
+      vira um número na base σ.
+    - A varredura segue linha de blocos por linha de blocos, guardando a
+      borda de baixo de cada coluna de blocos (um código por coluna) e a
+      borda da direita do bloco anterior.
+    - Blocos completos: uma consulta à tabela. Blocos incompletos (última
+      linha/coluna): _bloco_direto.
+    - Resposta = valor do canto inferior esquerdo (m na edição, 0 na LCS)
+      + soma das diferenças da última linha.
+    """
+    m, n = len(str1), len(str2)
+    edicao = problema == "edicao"
+    if m == 0 or n == 0:
+        return m + n if edicao else 0
+
+    alfabeto = sorted(set(str1) | set(str2))
+    if t is None:
+        t = escolher_t(len(alfabeto), problema, m * n)
+    tabela = carregar_tabela(alfabeto, t, problema, dir_cache)
+
+    simbolo = {c: s for s, c in enumerate(alfabeto)}
+    sigma_t = len(alfabeto) ** t
+    k_t = _BASE[problema] ** t
+
+    def pedacos(seq):
+        cortes = [seq[i:i + t] for i in range(0, len(seq), t)]
+        codigos = []
+        for pedaco in cortes:
+            codigo = 0
+            for c in reversed(pedaco):
+                codigo = codigo * len(alfabeto) + simbolo[c]
+            codigos.append(codigo)
+        return cortes, codigos
+
+    cortes1, codigos1 = pedacos(str1)
+    cortes2, codigos2 = pedacos(str2)
+    completo1 = [len(p) == t for p in cortes1]
+    completo2 = [len(p) == t for p in cortes2]
+
+    inicial = 1 if edicao else 0
+    baixo = [_codificar([inicial] * len(p), problema) for p in cortes2]
+    deslocamento2 = [c * k_t * k_t for c in codigos2]
+
+    for bi, pedaco1 in enumerate(cortes1):
+        esquerda = _codificar([inicial] * len(pedaco1), problema)
+        base_linha = codigos1[bi] * sigma_t * k_t * k_t
+        linha_completa = completo1[bi]
+
+        for bj, pedaco2 in enumerate(cortes2):
+            if linha_completa and completo2[bj]:
+                resultado = tabela[base_linha + deslocamento2[bj] + baixo[bj] * k_t + esquerda]
+                baixo[bj], esquerda = divmod(resultado, k_t)
+            else:
+                topo = _decodificar(baixo[bj], len(pedaco2), problema)
+                lado = _decodificar(esquerda, len(pedaco1), problema)
+                novo_baixo, nova_direita = _bloco_direto(pedaco1, pedaco2, topo, lado, problema)
+                baixo[bj] = _codificar(novo_baixo, problema)
+                esquerda = _codificar(nova_direita, problema)
+
+    total = m if edicao else 0
+    for bj, pedaco2 in enumerate(cortes2):
+        total += sum(_decodificar(baixo[bj], len(pedaco2), problema))
+    return total
+
+
+def main():
+    problema = opcao_da_linha_de_comando("problema", "edicao")
+    t = opcao_da_linha_de_comando("t", 0) or None
+
+    print(f"Quatro Russos — {problema}\n")
+    print("=" * 60)
+
+    for caminho in casos_da_linha_de_comando(DIR_CASOS_LCS if problema == "lcs" else DIR_CASOS):
+        str1, str2 = ler_caso(caminho)
+        alfabeto = set(str1) | set(str2)
+        t_usado = t or escolher_t(len(alfabeto), problema, len(str1) * len(str2))
+
+        inicio = time.perf_counter()
+        valor = quatro_russos(str1, str2, problema, t_usado)
+        tempo_ms = (time.perf_counter() - inicio) * 1000
+
+        print(f"✓ {caminho}")
+        print(f"  |str1|={len(str1):,}, |str2|={len(str2):,}, σ={len(alfabeto)}, t={t_usado}")
+        print(f"  {'distância' if problema == 'edicao' else 'LCS'}={valor:,}, {tempo_ms:.2f} ms")
+        print()
+
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
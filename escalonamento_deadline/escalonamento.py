@@ -0,0 +1,92 @@
+# Funções comuns aos algoritmos de Escalonamento com Deadline
+# Leitura dos casos de teste no formato escrito por
+# casos_teste/gerar_casos_escalonamento.py:
+#
+#   N
+#   id deadline penalidade      (uma linha por tarefa)
+#
+# Cada tarefa ocupa uma unidade de tempo; perder o deadline custa a penalidade.
+# Formato estendido (durações diferentes): a linha pode trazer uma quarta
+# coluna com a duração da tarefa, "id deadline penalidade duracao".
+
+import os
+import sys
+
+import numpy as np
+
+DIR_CASOS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "casos_teste")
+
+
+def ler_caso(caminho):
+    """
+    Lê um arquivo de caso e devolve a lista de tarefas (id, deadline,
+    penalidade). Durações do formato estendido são ignoradas (ver
+    ler_caso_com_duracao).
+    """
+    return [tarefa[:3] for tarefa in ler_caso_com_duracao(caminho)]
+
+
+def ler_caso_com_duracao(caminho):
+    """
+    Lê um arquivo de caso e devolve a lista de tarefas (id, deadline,
+    penalidade, duracao); sem a quarta coluna, a duração é 1.
+    """
+    with open(caminho) as f:
+        n = int(f.readline())
+        tarefas = []
+        for _ in range(n):
+            campos = list(map(int, f.readline().split()))
+            tid, deadline, penalidade = campos[:3]
+            duracao = campos[3] if len(campos) > 3 else 1
+            tarefas.append((tid, deadline, penalidade, duracao))
+
+    return tarefas
+
+
+def ler_caso_vetores(caminho):
+    """
+    Lê um arquivo de caso como três vetores NumPy (ids, deadlines,
+    penalidades).
+
+    Explicação:
+    - O arquivo inteiro é lido de uma vez por np.fromfile, sem criar uma
+      tupla por tarefa: serve para casos com milhões de linhas.
+    - Apenas o formato de três colunas (tarefas unitárias); um arquivo com
+      outro número de campos gera ValueError.
+    """
+    numeros = np.fromfile(caminho, dtype=np.int64, sep=" ")
+    n = int(numeros[0])
+    if len(numeros) != 1 + 3 * n:
+        raise ValueError(
+            f"{caminho}: esperados {3 * n} números para {n} tarefas de três colunas, lidos {len(numeros) - 1} "
+            "(para o formato com duração, use ler_caso_com_duracao)"
+        )
+    tarefas = numeros[1:1 + 3 * n].reshape(n, 3)
+    return tarefas[:, 0].copy(), tarefas[:, 1].copy(), tarefas[:, 2].copy()
+
+
+def casos_da_linha_de_comando(dir_casos=DIR_CASOS):
+    """
+    Caminhos passados na linha de comando ou, se nenhum, todos os casos
+    de dir_casos (caso1.txt, caso2.txt, ...). Opções "--nome=valor"
+    são ignoradas aqui (ver opcao_da_linha_de_comando).
+    """
+    caminhos = [a for a in sys.argv[1:] if not a.startswith("--")]
+    if caminhos:
+        return caminhos
+
+    nomes = [n for n in os.listdir(dir_casos) if n.startswith("caso") and n.endswith(".txt")]
+    nomes.sort(key=lambda n: int(n[4:-4]))
+    return [os.path.join(dir_casos, n) for n in nomes]
+
+
+def opcao_da_linha_de_comando(nome, padrao):
+    """
+    Valor de "--nome=valor" na linha de comando, convertido para o tipo do
+    padrão; devolve o padrão se a opção não foi passada.
+    """
+    prefixo = f"--{nome}="
+    for argumento in sys.argv[1:]:
+        if argumento.startswith(prefixo):
+            return type(padrao)(argumento[len(prefixo):])
+    return padrao
@@ -0,0 +1,114 @@
+# Escalonamento com Deadline em fluxo (tarefas chegando em ordem de deadline)
+# Quando as tarefas chegam continuamente, não há um arquivo "N + tarefas"
+# para ordenar por penalidade. Se elas chegam em ordem de deadline, basta um
+# heap de mínimo com as penalidades aceitas: cada tarefa entra e, se não
+# couber mais antes do seu deadline, sai a aceita de MENOR penalidade (estilo
+# Moore–Hodgson). O(log n) por chegada e memória proporcional às aceitas.
+#
+# Uso: python escalonamento_online.py [caso.txt ... | -]
+#      "-" lê linhas "id deadline penalidade" da entrada padrão, já em ordem
+#      de deadline; os casos de arquivo são ordenados antes de entrar no fluxo.
+
+import heapq
+import sys
+import time
+from itertools import count
+
+from escalonamento import casos_da_linha_de_comando, ler_caso
+
+
+class EscalonadorOnline:
+    """
+    Conjunto ótimo de tarefas unitárias aceitas, atualizado a cada chegada.
+
+    Explicação:
+    - Com as tarefas em ordem de deadline, as aceitas cabem na agenda se e
+      só se, para a última chegada, len(aceitas) <= deadline (EDD: a k-ésima
+      aceita termina no instante k).
+    - Ao passar do limite, descartar a aceita de menor penalidade deixa o
+      conjunto com a maior penalidade total possível entre as tarefas já
+      vistas (troca de matroide), então a penalidade perdida é sempre a
+      mínima do prefixo do fluxo.
+    - O heap guarda (penalidade, ordem de chegada, id, deadline); empates
+      descartam a tarefa que chegou primeiro.
+    """
+
+    def __init__(self):
+        self._heap = []
+        self._chegada = count()
+        self._ultimo_deadline = None
+        self.penalidade_perdida = 0
+        self.recebidas = 0
+
+    def adicionar(self, tid, deadline, penalidade):
+        """
+        Recebe uma tarefa; devolve a tarefa descartada (id, deadline,
+        penalidade) ou None se todas as aceitas continuam cabendo.
+        """
+        if self._ultimo_deadline is not None and deadline < self._ultimo_deadline:
+            raise ValueError(f"tarefa {tid}: deadline {deadline} chegou depois de {self._ultimo_deadline}")
+        self._ultimo_deadline = deadline
+        self.recebidas += 1
+
+        heapq.heappush(self._heap, (penalidade, next(self._chegada), tid, deadline))
+        if len(self._heap) <= max(deadline, 0):
+            return None
+
+        penalidade, _, tid, deadline = heapq.heappop(self._heap)
+        self.penalidade_perdida += penalidade
+        return tid, deadline, penalidade
+
+    def aceitas(self):
+        """Tarefas aceitas na ordem de execução (deadline, depois chegada), como (id, deadline, penalidade)."""
+        ordem = sorted(self._heap, key=lambda t: (t[3], t[1]))
+        return [(tid, deadline, penalidade) for penalidade, _, tid, deadline in ordem]
+
+    def __len__(self):
+        return len(self._heap)
+
+
+def ler_fluxo(arquivo):
+    """
+    Gera (id, deadline, penalidade) de cada linha do arquivo, sob demanda.
+    Linhas com um único número (o N do formato de caso) são ignoradas.
+    """
+    for linha in arquivo:
+        campos = linha.split()
+        if len(campos) >= 3:
+            yield int(campos[0]), int(campos[1]), int(campos[2])
+
+
+def main():
+    caminhos = casos_da_linha_de_comando()
+
+    print("Escalonamento com Deadline — em fluxo (heap de aceitas)\n")
+    print("=" * 60)
+
+    for caminho in caminhos:
+        if caminho == "-":
+            fluxo = ler_fluxo(sys.stdin)
+        else:
+            fluxo = sorted(ler_caso(caminho), key=lambda t: t[1])
+
+        inicio = time.perf_counter()
+        escalonador = EscalonadorOnline()
+        descartadas = 0
+        for tarefa in fluxo:
+            if escalonador.adicionar(*tarefa) is not None:
+                descartadas += 1
+        tempo_ms = (time.perf_counter() - inicio) * 1000
+
+        print(f"✓ {'entrada padrão' if caminho == '-' else caminho}")
+        print(f"  recebidas={escalonador.recebidas:,}, aceitas={len(escalonador):,}, "
+              f"descartadas={descartadas:,}")
+        aceitas = [tid for tid, _, _ in escalonador.aceitas()]
+        print(f"  agenda (ids)={aceitas[:12]}{' ...' if len(aceitas) > 12 else ''}")
+        print(f"  penalidade perdida={escalonador.penalidade_perdida:,}")
+        print(f"  tempo={tempo_ms:.2f} ms")
+        print()
+
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
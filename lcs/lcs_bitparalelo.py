@@ -0,0 +1,118 @@
+# LCS bit-paralela (Allison–Dix / Hyyrö) sobre inteiros do Python
+# O COMPRIMENTO da LCS não precisa da tabela (m+1) × (n+1): uma linha inteira da
+# PD cabe em um único inteiro de n bits, e cada caractere da outra sequência
+# atualiza a linha com poucas operações aritméticas sobre palavras de máquina.
+#
+# Uso: python lcs_bitparalelo.py [caso.txt ...]
+
+import time
+from itertools import accumulate
+
+from lcs import casos_da_linha_de_comando, ler_caso
+
+
+def mascaras_de_ocorrencia(seq):
+    """
+    Para cada caractere c, um inteiro cujo bit i vale 1 se seq[i] == c.
+
+    Explicação:
+    - Memória O(σ·n/w): uma máscara de n bits por caractere distinto.
+    - Montamos as posições em listas e convertemos cada uma de uma vez,
+      evitando criar n inteiros gigantes intermediários.
+    """
+    posicoes = {}
+    for i, c in enumerate(seq):
+        posicoes.setdefault(c, []).append(i)
+
+    mascaras = {}
+    for c, lista in posicoes.items():
+        bits = bytearray(len(seq) // 8 + 1)
+        for i in lista:
+            bits[i >> 3] |= 1 << (i & 7)
+        mascaras[c] = int.from_bytes(bits, "little")
+
+    return mascaras
+
+
+def _vetor_final(percorrida, seq_bits):
+    """
+    Vetor V depois de percorrer "percorrida" com os bits sobre "seq_bits".
+
+    Explicação:
+    - V guarda, em forma complementada, as diferenças entre colunas
+      vizinhas da linha atual da PD: bit j = 0 quando a linha "sobe" em j.
+    - Para cada caractere ch da sequência percorrida (Hyyrö, 2004):
+          U = V & M[ch]
+          V = ((V + U) | (V - U)) & todos_uns
+      A soma propaga o "vai um" ao longo dos bits — é ela que faz o papel
+      do laço interno da PD clássica.
+    """
+    mascaras = mascaras_de_ocorrencia(seq_bits)
+    todos_uns = (1 << len(seq_bits)) - 1
+    v = todos_uns
+
+    for ch in percorrida:
+        m = mascaras.get(ch)
+        if m is None:
+            continue
+        u = v & m
+        v = ((v + u) | (v - u)) & todos_uns
+
+    return v
+
+
+def lcs_comprimento_bits(seq1, seq2):
+    """
+    Comprimento da LCS em O(n·m/w) operações de palavra.
+
+    Explicação:
+    - A sequência menor vira o vetor de bits (menos memória); a maior é
+      percorrida caractere a caractere (_vetor_final).
+    - No fim, LCS = n − (número de bits 1 em V).
+    """
+    if len(seq1) < len(seq2):
+        seq1, seq2 = seq2, seq1
+    if not seq2:
+        return 0
+
+    return len(seq2) - _vetor_final(seq1, seq2).bit_count()
+
+
+def linha_lcs(seq1, seq2):
+    """
+    Última linha da tabela da PD: [LCS(seq1, seq2[:j]) para j = 0..n].
+
+    Explicação:
+    - Sai do mesmo vetor V: a linha na coluna j é o número de bits 0
+      entre os j primeiros bits.
+    - Usada pela reconstrução em espaço linear (lcs_hirschberg.py).
+    """
+    n = len(seq2)
+    if n == 0:
+        return [0]
+
+    bits = format(_vetor_final(seq1, seq2), f"0{n}b")[::-1]
+    return list(accumulate(map("0".__eq__, bits), initial=0))
+
+
+def main():
+    print("LCS — bit-paralela (Allison–Dix / Hyyrö)\n")
+    print("=" * 60)
+
+    for caminho in casos_da_linha_de_comando():
+        seq1, seq2 = ler_caso(caminho)
+
+        inicio = time.perf_counter()
+        comprimento = lcs_comprimento_bits(seq1, seq2)
+        tempo_ms = (time.perf_counter() - inicio) * 1000
+
+        print(f"✓ {caminho}")
+        print(f"  |seq1|={len(seq1):,}, |seq2|={len(seq2):,}")
+        print(f"  LCS={comprimento:,}, {tempo_ms:.2f} ms")
+        print()
+
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+# LCS esparsa (Hunt–Szymanski) com escolha automática do motor
+# A PD clássica paga O(m·n) mesmo quando quase nenhum par de caracteres coincide.
+# Hunt–Szymanski só visita os r pares (i, j) com seq1[i] == seq2[j], mantendo
+# uma LIS ("paciência") com busca binária: O((r + m) log n).
+#
+# Uso: python lcs_esparsa.py [caso.txt ...]
+
+import time
+from bisect import bisect_left
+from collections import Counter
+
+from lcs import casos_da_linha_de_comando, ler_caso
+from lcs_bitparalelo import lcs_comprimento_bits
+from lcs_hirschberg import lcs_hirschberg
+from lcs_pd import lcs_pd
+
+# Hunt–Szymanski é usado se r <= DENSIDADE_ESPARSA · m · n. Cada par custa uma
+# busca binária em Python, enquanto o motor bit-paralelo processa 64 células
+# por operação em C; por isso a fração é bem pequena.
+DENSIDADE_ESPARSA = 0.001
+
+# Até este número de células a tabela completa (lcs_pd) é aceitável.
+CELULAS_TABELA = 4_000_000
+
+
+def contar_pares(seq1, seq2):
+    """
+    Número r de pares (i, j) com seq1[i] == seq2[j], pelos histogramas.
+
+    Explicação:
+    - r = soma, sobre cada caractere c, de ocorrências(c, seq1) ·
+      ocorrências(c, seq2). Custa O(m + n), sem enumerar os pares.
+    """
+    contagem1 = Counter(seq1)
+    contagem2 = Counter(seq2)
+    return sum(q * contagem2[c] for c, q in contagem1.items() if c in contagem2)
+
+
+def lcs_hunt_szymanski(seq1, seq2):
+    """
+    Devolve uma LCS visitando apenas os pares coincidentes.
+
+    Explicação:
+    - Para cada caractere, as posições dele em seq2 em ordem DECRESCENTE.
+    - Percorrendo seq1, cada par (i, j) tenta estender uma subsequência:
+      limiares[k] é o menor j que termina uma subsequência comum de
+      tamanho k + 1. Uma busca binária acha onde j entra.
+    - Visitar os j de cada i em ordem decrescente impede que duas
+      posições de seq2 casem com o mesmo i na mesma cadeia.
+    - elos[k] guarda o último par usado no tamanho k + 1 e o elo anterior,
+      o que permite reconstruir a subsequência no fim.
+    """
+    posicoes = {}
+    for j in range(len(seq2) - 1, -1, -1):
+        posicoes.setdefault(seq2[j], []).append(j)
+
+    limiares = []
+    elos = []
+
+    for c in seq1:
+        lista = posicoes.get(c)
+        if lista is None:
+            continue
+        for j in lista:
+            k = bisect_left(limiares, j)
+            elo = (j, elos[k - 1] if k else None)
+            if k == len(limiares):
+                limiares.append(j)
+                elos.append(elo)
+            else:
+                limiares[k] = j
+                elos[k] = elo
+
+    resposta = []
+    elo = elos[-1] if elos else None
+    while elo is not None:
+        j, elo = elo
+        resposta.append(seq2[j])
+    resposta.reverse()
+
+    return "".join(resposta)
+
+
+def lcs_automatica(seq1, seq2, reconstruir=True):
+    """
+    Escolhe o motor de LCS a partir do número de pares coincidentes.
+
+    Explicação:
+    - r <= DENSIDADE_ESPARSA · m · n: entrada esparsa → Hunt–Szymanski.
+    - Tabela pequena (m · n <= CELULAS_TABELA): PD clássica.
+    - Entrada grande e densa: bit-paralelo para o comprimento, ou
+      Hirschberg sobre o bit-paralelo quando a subsequência é pedida.
+    - Devolve (resposta, motor): resposta é a subsequência, ou só o
+      comprimento se reconstruir=False.
+    """
+    m, n = len(seq1), len(seq2)
+    r = contar_pares(seq1, seq2)
+
+    if r <= DENSIDADE_ESPARSA * m * n:
+        subsequencia = lcs_hunt_szymanski(seq1, seq2)
+        motor = "hunt-szymanski"
+    elif m * n <= CELULAS_TABELA:
+        subsequencia = lcs_pd(seq1, seq2)
+        motor = "tabela"
+    elif reconstruir:
+        subsequencia = lcs_hirschberg(seq1, seq2)
+        motor = "hirschberg"
+    else:
+        return lcs_comprimento_bits(seq1, seq2), "bit-paralelo"
+
+    if reconstruir:
+        return subsequencia, motor
+    return len(subsequencia), motor
+
+
+def main():
+    print("LCS — Hunt–Szymanski com escolha automática\n")
+    print("=" * 60)
+
+    for caminho in casos_da_linha_de_comando():
+        seq1, seq2 = ler_caso(caminho)
+
+        inicio = time.perf_counter()
+        comprimento, motor = lcs_automatica(seq1, seq2, reconstruir=False)
+        tempo_ms = (time.perf_counter() - inicio) * 1000
+
+        print(f"✓ {caminho}")
+        print(f"  |seq1|={len(seq1):,}, |seq2|={len(seq2):,}, pares r={contar_pares(seq1, seq2):,}")
+        print(f"  LCS={comprimento:,} via {motor}, {tempo_ms:.2f} ms")
+        print()
+
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+# LCS em espaço linear (Hirschberg)
+# A reconstrução clássica precisa da tabela inteira (~380 MB em caso5). Aqui a
+# subsequência é montada por divisão e conquista guardando só linhas da PD:
+# memória O(min(m, n)). As linhas vêm do motor bit-paralelo, então cada
+# nível da recursão custa O(m·n/w).
+#
+# Uso: python lcs_hirschberg.py [caso.txt ...]
+
+import time
+import tracemalloc
+
+from lcs import casos_da_linha_de_comando, ler_caso
+from lcs_bitparalelo import linha_lcs
+from lcs_pd import lcs_pd
+
+# Abaixo deste número de células a tabela completa é mais rápida que dividir.
+CELULAS_CASO_BASE = 4096
+
+
+def _hirschberg(seq1, seq2, partes):
+    """
+    Acrescenta em "partes" os pedaços da LCS de seq1 e seq2, em ordem.
+
+    Explicação:
+    - Divide seq1 ao meio: seq1 = esquerda + direita.
+    - frente[j] = LCS(esquerda, seq2[:j]) (linha para frente).
+    - tras[k]   = LCS(direita, seq2[n-k:]) (linha das sequências invertidas).
+    - O ponto de corte j maximiza frente[j] + tras[n - j]: existe uma LCS
+      que usa seq2[:j] com a esquerda e seq2[j:] com a direita.
+    - Resolve as duas metades recursivamente. Só as linhas do nível atual
+      ficam vivas, de tamanho n + 1.
+    """
+    m, n = len(seq1), len(seq2)
+    if m == 0 or n == 0:
+        return
+    if m * n <= CELULAS_CASO_BASE or m == 1:
+        partes.append(lcs_pd(seq1, seq2))
+        return
+
+    meio = m // 2
+    esquerda, direita = seq1[:meio], seq1[meio:]
+
+    frente = linha_lcs(esquerda, seq2)
+    tras = linha_lcs(direita[::-1], seq2[::-1])
+    corte = max(range(n + 1), key=lambda j: frente[j] + tras[n - j])
+    del frente, tras
+
+    _hirschberg(esquerda, seq2[:corte], partes)
+    _hirschberg(direita, seq2[corte:], partes)
+
+
+def lcs_hirschberg(seq1, seq2):
+    """
+    Devolve uma LCS de seq1 e seq2 usando memória O(min(m, n)).
+
+    Explicação:
+    - A sequência menor fica como seq2 (a das linhas); a maior é a dividida.
+    - Tempo O(m·n/w · log m): cada nível da recursão percorre no total as
+      duas sequências uma vez.
+    """
+    if len(seq1) < len(seq2):
+        seq1, seq2 = seq2, seq1
+
+    partes = []
+    _hirschberg(seq1, seq2, partes)
+    return "".join(partes)
+
+
+def main():
+    print("LCS — reconstrução em espaço linear (Hirschberg)\n")
+    print("=" * 60)
+
+    for caminho in casos_da_linha_de_comando():
+        seq1, seq2 = ler_caso(caminho)
+
+        tracemalloc.start()
+        inicio = time.perf_counter()
+        subsequencia = lcs_hirschberg(seq1, seq2)
+        tempo_ms = (time.perf_counter() - inicio) * 1000
+        _, pico = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print(f"✓ {caminho}")
+        print(f"  |seq1|={len(seq1):,}, |seq2|={len(seq2):,}")
+        print(f"  LCS={len(subsequencia):,}: {subsequencia[:40]}{'...' if len(subsequencia) > 40 else ''}")
+        print(f"  pico de memória={pico / (1024 * 1024):.2f} MB, {tempo_ms:.2f} ms")
+        print()
+
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
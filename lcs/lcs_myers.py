@@ -0,0 +1,127 @@
+# Diff de Myers O((n+m)·D) para sequências quase iguais
+# Quando as duas sequências diferem em poucas posições (caso4: idênticas;
+# caso6: uma rotação de uma posição), o número D de inserções + remoções é
+# pequeno. O algoritmo guloso de Myers anda pelas diagonais e só paga pelas
+# diferenças: caso6 vira uma passada linear em vez de 10^10 células.
+#
+# Uso: python lcs_myers.py [--limite=1000] [caso.txt ...]
+
+import time
+
+from lcs import casos_da_linha_de_comando, ler_caso, opcao_da_linha_de_comando
+
+
+def diff_myers(seq1, seq2, limite_d=None):
+    """
+    LCS e script de edição (inserções/remoções) em O((n+m)·D).
+
+    Explicação:
+    - Diagonal k = x − y, onde x anda em seq1 e y em seq2.
+    - Na rodada d, v[k] é o x mais distante alcançável na diagonal k com
+      exatamente d edições. Ele vem de k+1 (inserção, desce) ou de k−1
+      (remoção, anda para a direita), e depois "escorrega" pela diagonal
+      enquanto os caracteres coincidem (a "cobra").
+    - Ao chegar em (n, m), D = d é mínimo e LCS = (n + m − D) / 2.
+    - As linhas v de cada rodada (só as diagonais −d..d) são guardadas para
+      refazer o caminho de trás para frente: memória O(D²).
+    - Se D passar de limite_d, desiste e devolve None.
+    - Devolve (lcs, script), com script em ordem e itens
+      ("-", i, seq1[i]) para remover e ("+", j, seq2[j]) para inserir.
+    """
+    n, m = len(seq1), len(seq2)
+    if limite_d is None:
+        limite_d = n + m
+
+    deslocamento = limite_d + 1
+    v = [0] * (2 * limite_d + 3)
+    rodadas = []
+
+    for d in range(limite_d + 1):
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and v[deslocamento + k - 1] < v[deslocamento + k + 1]):
+                x = v[deslocamento + k + 1]
+            else:
+                x = v[deslocamento + k - 1] + 1
+            y = x - k
+            while x < n and y < m and seq1[x] == seq2[y]:
+                x += 1
+                y += 1
+            v[deslocamento + k] = x
+
+            if x >= n and y >= m:
+                rodadas.append(v[deslocamento - d:deslocamento + d + 1])
+                return _refazer_caminho(seq1, seq2, rodadas)
+
+        rodadas.append(v[deslocamento - d:deslocamento + d + 1])
+
+    return None
+
+
+def _refazer_caminho(seq1, seq2, rodadas):
+    """
+    Volta de (n, m) até (0, 0) usando as linhas salvas de cada rodada.
+
+    Explicação:
+    - Na rodada d, a diagonal k veio de k+1 ou k−1 pela mesma regra usada
+      na ida (consultando a rodada d−1).
+    - O trecho da cobra entre o fim da edição e (x, y) é parte da LCS.
+    """
+    x, y = len(seq1), len(seq2)
+    trechos = []
+    script = []
+
+    for d in range(len(rodadas) - 1, 0, -1):
+        anterior = rodadas[d - 1]
+        k = x - y
+        if k == -d or (k != d and anterior[k - 1 + d - 1] < anterior[k + 1 + d - 1]):
+            k_anterior = k + 1
+        else:
+            k_anterior = k - 1
+        x_anterior = anterior[k_anterior + d - 1]
+        y_anterior = x_anterior - k_anterior
+
+        if k_anterior == k + 1:
+            inicio_x = x_anterior
+            script.append(("+", y_anterior, seq2[y_anterior]))
+        else:
+            inicio_x = x_anterior + 1
+            script.append(("-", x_anterior, seq1[x_anterior]))
+        trechos.append(seq1[inicio_x:x])
+
+        x, y = x_anterior, y_anterior
+
+    trechos.append(seq1[:x])
+    trechos.reverse()
+    script.reverse()
+
+    return "".join(trechos), script
+
+
+def main():
+    limite_d = opcao_da_linha_de_comando("limite", 1000)
+
+    print(f"LCS — diff de Myers O((n+m)·D), D <= {limite_d}\n")
+    print("=" * 60)
+
+    for caminho in casos_da_linha_de_comando():
+        seq1, seq2 = ler_caso(caminho)
+
+        inicio = time.perf_counter()
+        resultado = diff_myers(seq1, seq2, limite_d)
+        tempo_ms = (time.perf_counter() - inicio) * 1000
+
+        print(f"✓ {caminho}")
+        print(f"  |seq1|={len(seq1):,}, |seq2|={len(seq2):,}")
+        if resultado is None:
+            print(f"  D > {limite_d}: desistiu após {tempo_ms:.2f} ms")
+        else:
+            subsequencia, script = resultado
+            print(f"  LCS={len(subsequencia):,}, D={len(script)}, {tempo_ms:.2f} ms")
+            print(f"  script={script[:6]}{' ...' if len(script) > 6 else ''}")
+        print()
+
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+# LCS por Programação Dinâmica clássica (tabela completa)
+# Referência O(m·n) em tempo e memória. Continua sendo a melhor escolha para
+# entradas pequenas, e é o caso base das estratégias em espaço linear.
+
+
+def lcs_pd(seq1, seq2):
+    """
+    Devolve uma LCS de seq1 e seq2 (a própria subsequência).
+
+    Explicação:
+    - tabela[i][j] = LCS(seq1[:i], seq2[:j]).
+    - Se seq1[i-1] == seq2[j-1], tabela[i][j] = tabela[i-1][j-1] + 1;
+      senão, o maior entre tabela[i-1][j] e tabela[i][j-1].
+    - A subsequência é reconstruída voltando de tabela[m][n] até a borda.
+    """
+    m, n = len(seq1), len(seq2)
+    tabela = [[0] * (n + 1) for _ in range(m + 1)]
+
+    for i in range(1, m + 1):
+        anterior, atual = tabela[i - 1], tabela[i]
+        c = seq1[i - 1]
+        for j in range(1, n + 1):
+            if c == seq2[j - 1]:
+                atual[j] = anterior[j - 1] + 1
+            elif anterior[j] >= atual[j - 1]:
+                atual[j] = anterior[j]
+            else:
+                atual[j] = atual[j - 1]
+
+    resposta = []
+    i, j = m, n
+    while i > 0 and j > 0:
+        if seq1[i - 1] == seq2[j - 1]:
+            resposta.append(seq1[i - 1])
+            i -= 1
+            j -= 1
+        elif tabela[i - 1][j] >= tabela[i][j - 1]:
+            i -= 1
+        else:
+            j -= 1
+    resposta.reverse()
+
+    return "".join(resposta)
@@ -0,0 +1,215 @@
+# Tabela de PD em blocos por frente de onda (anti-diagonais), em vários núcleos
+# Tanto a LCS quanto a Distância de Edição preenchem uma tabela (m+1) × (n+1)
+# onde cada célula depende de cima, da esquerda e da diagonal. Dividindo a
+# tabela em blocos B × B, todos os blocos de uma mesma anti-diagonal de blocos
+# são independentes e podem rodar em paralelo.
+#
+# As bordas entre blocos ficam em multiprocessing.shared_memory: os processos
+# recebem só os índices (I, J) do bloco — nenhuma linha é serializada.
+#
+# Uso: python wavefront.py [--problema=lcs|edicao] [--bloco=1024]
+#                          [--trabalhadores=N] [caso.txt ...]
+
+import os
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from lcs import DIR_CASOS, casos_da_linha_de_comando, ler_caso, opcao_da_linha_de_comando
+
+# Os casos de edicao_strings usam o mesmo formato de duas linhas.
+DIR_CASOS_EDICAO = os.path.normpath(os.path.join(DIR_CASOS, "..", "..", "edicao_strings", "casos_teste"))
+
+
+def _bloco_lcs(seq1, seq2, topo, esquerda):
+    """Recorrência da LCS sobre um bloco, dadas a borda de cima e a da esquerda."""
+    linha = topo
+    direita = [linha[-1]]
+    for i, c in enumerate(seq1, 1):
+        nova = [esquerda[i]]
+        for j, d in enumerate(seq2, 1):
+            if c == d:
+                nova.append(linha[j - 1] + 1)
+            else:
+                cima, lado = linha[j], nova[j - 1]
+                nova.append(cima if cima >= lado else lado)
+        linha = nova
+        direita.append(linha[-1])
+    return linha, direita
+
+
+def _bloco_edicao(seq1, seq2, topo, esquerda):
+    """Recorrência de Levenshtein sobre um bloco, dadas as bordas."""
+    linha = topo
+    direita = [linha[-1]]
+    for i, c in enumerate(seq1, 1):
+        nova = [esquerda[i]]
+        for j, d in enumerate(seq2, 1):
+            melhor = linha[j - 1] if c == d else linha[j - 1] + 1
+            if linha[j] + 1 < melhor:
+                melhor = linha[j] + 1
+            if nova[j - 1] + 1 < melhor:
+                melhor = nova[j - 1] + 1
+            nova.append(melhor)
+        linha = nova
+        direita.append(linha[-1])
+    return linha, direita
+
+
+# Cada problema entra com (borda da primeira linha/coluna, recorrência do bloco).
+# LCS: bordas zeradas. Edição: transformar prefixo em vazio custa o tamanho dele.
+RECORRENCIAS = {
+    "lcs": (lambda k: 0, _bloco_lcs),
+    "edicao": (lambda k: k, _bloco_edicao),
+}
+
+# Estado de cada processo trabalhador (preenchido por _iniciar_trabalhador).
+_estado = {}
+
+
+def _iniciar_trabalhador(nome_linhas, nome_colunas, seq1, seq2, bloco, problema):
+    """
+    Conecta o processo às bordas compartilhadas.
+
+    Explicação:
+    - linhas[I] é a linha global i = I·B da tabela (n + 1 valores).
+    - colunas[J] é a coluna global j = J·B (m + 1 valores).
+    - As duas sequências chegam uma única vez por processo.
+    """
+    memoria_linhas = shared_memory.SharedMemory(name=nome_linhas)
+    memoria_colunas = shared_memory.SharedMemory(name=nome_colunas)
+    _estado.update(
+        memorias=(memoria_linhas, memoria_colunas),
+        linhas=memoria_linhas.buf.cast("q"),
+        colunas=memoria_colunas.buf.cast("q"),
+        seq1=seq1,
+        seq2=seq2,
+        bloco=bloco,
+        recorrencia=RECORRENCIAS[problema][1],
+    )
+
+
+def _calcular_bloco(bloco_i, bloco_j):
+    """
+    Calcula o bloco (I, J) e grava sua borda de baixo e da direita.
+
+    Explicação:
+    - Lê a borda de cima em linhas[I] e a da esquerda em colunas[J].
+    - Escreve a última linha em linhas[I + 1] e a última coluna em
+      colunas[J + 1], que são as bordas dos blocos da próxima anti-diagonal.
+    """
+    seq1, seq2, b = _estado["seq1"], _estado["seq2"], _estado["bloco"]
+    m, n = len(seq1), len(seq2)
+    linhas, colunas = _estado["linhas"], _estado["colunas"]
+
+    i0, i1 = bloco_i * b, min(m, (bloco_i + 1) * b)
+    j0, j1 = bloco_j * b, min(n, (bloco_j + 1) * b)
+
+    topo = linhas[bloco_i * (n + 1) + j0:bloco_i * (n + 1) + j1 + 1].tolist()
+    esquerda = colunas[bloco_j * (m + 1) + i0:bloco_j * (m + 1) + i1 + 1].tolist()
+
+    baixo, direita = _estado["recorrencia"](seq1[i0:i1], seq2[j0:j1], topo, esquerda)
+
+    inicio = (bloco_i + 1) * (n + 1)
+    linhas[inicio + j0:inicio + j1 + 1] = array("q", baixo)
+    inicio = (bloco_j + 1) * (m + 1)
+    colunas[inicio + i0:inicio + i1 + 1] = array("q", direita)
+
+
+def _liberar_trabalhador():
+    for visao in (_estado.pop("linhas", None), _estado.pop("colunas", None)):
+        if visao is not None:
+            visao.release()
+    for memoria in _estado.pop("memorias", ()):
+        memoria.close()
+
+
+def tabela_wavefront(seq1, seq2, problema="lcs", bloco=1024, trabalhadores=None):
+    """
+    Valor da última célula da tabela (LCS ou distância de edição).
+
+    Explicação:
+    - A tabela é dividida em ceil(m/B) × ceil(n/B) blocos.
+    - A anti-diagonal de blocos d contém os blocos com I + J = d; eles só
+      dependem de blocos da anti-diagonal d − 1, então rodam em paralelo.
+    - Memória compartilhada: ceil(m/B) + 1 linhas e ceil(n/B) + 1 colunas
+      de bordas, O(m·n/B) inteiros — a tabela inteira nunca existe.
+    - Com trabalhadores=1 tudo roda no próprio processo (sem pool), pelo
+      mesmo caminho de código.
+    """
+    borda, _ = RECORRENCIAS[problema]
+    m, n = len(seq1), len(seq2)
+    if m == 0 or n == 0:
+        return borda(m + n)
+
+    blocos_i = (m + bloco - 1) // bloco
+    blocos_j = (n + bloco - 1) // bloco
+    trabalhadores = trabalhadores or os.cpu_count() or 1
+
+    memoria_linhas = shared_memory.SharedMemory(create=True, size=8 * (blocos_i + 1) * (n + 1))
+    memoria_colunas = shared_memory.SharedMemory(create=True, size=8 * (blocos_j + 1) * (m + 1))
+    linhas = memoria_linhas.buf.cast("q")
+    colunas = memoria_colunas.buf.cast("q")
+    try:
+        linhas[0:n + 1] = array("q", (borda(j) for j in range(n + 1)))
+        colunas[0:m + 1] = array("q", (borda(i) for i in range(m + 1)))
+
+        argumentos = (memoria_linhas.name, memoria_colunas.name, seq1, seq2, bloco, problema)
+        anti_diagonais = [
+            [(i, d - i) for i in range(max(0, d - blocos_j + 1), min(d, blocos_i - 1) + 1)]
+            for d in range(blocos_i + blocos_j - 1)
+        ]
+
+        if trabalhadores == 1:
+            _iniciar_trabalhador(*argumentos)
+            try:
+                for diagonal in anti_diagonais:
+                    for i, j in diagonal:
+                        _calcular_bloco(i, j)
+            finally:
+                _liberar_trabalhador()
+        else:
+            with ProcessPoolExecutor(trabalhadores, initializer=_iniciar_trabalhador, initargs=argumentos) as pool:
+                for diagonal in anti_diagonais:
+                    list(pool.map(_calcular_bloco, *zip(*diagonal)))
+
+        resultado = linhas[blocos_i * (n + 1) + n]
+    finally:
+        linhas.release()
+        colunas.release()
+        memoria_linhas.close()
+        memoria_linhas.unlink()
+        memoria_colunas.close()
+        memoria_colunas.unlink()
+
+    return resultado
+
+
+def main():
+    problema = opcao_da_linha_de_comando("problema", "lcs")
+    bloco = opcao_da_linha_de_comando("bloco", 1024)
+    trabalhadores = opcao_da_linha_de_comando("trabalhadores", os.cpu_count() or 1)
+
+    caminhos = casos_da_linha_de_comando(DIR_CASOS_EDICAO if problema == "edicao" else DIR_CASOS)
+
+    print(f"Tabela por frente de onda — {problema}, bloco={bloco}, trabalhadores={trabalhadores}\n")
+    print("=" * 60)
+
+    for caminho in caminhos:
+        seq1, seq2 = ler_caso(caminho)
+
+        inicio = time.perf_counter()
+        valor = tabela_wavefront(seq1, seq2, problema, bloco, trabalhadores)
+        tempo_ms = (time.perf_counter() - inicio) * 1000
+
+        print(f"✓ {caminho}")
+        print(f"  |seq1|={len(seq1):,}, |seq2|={len(seq2):,}")
+        print(f"  {'LCS' if problema == 'lcs' else 'distância'}={valor:,}, {tempo_ms:.2f} ms")
+        print()
+
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
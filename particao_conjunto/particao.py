@@ -0,0 +1,60 @@
+# Funções comuns aos algoritmos de Partição de Conjunto
+# Leitura dos casos de teste no formato escrito por
+# casos_teste/gerar_casos_particao.py:
+#
+#   n
+#   x1 x2 ... xn    (os números numa única linha, separados por espaço)
+
+import os
+import sys
+
+DIR_CASOS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "casos_teste")
+
+
+def ler_caso(caminho):
+    """Lê um arquivo de caso e devolve a lista de números."""
+    with open(caminho) as f:
+        n = int(f.readline())
+        numeros = [int(x) for x in f.readline().split()]
+
+    if len(numeros) != n:
+        raise ValueError(f"{caminho}: esperados {n} números, lidos {len(numeros)}")
+    return numeros
+
+
+def casos_da_linha_de_comando(dir_casos=DIR_CASOS):
+    """
+    Caminhos passados na linha de comando ou, se nenhum, todos os casos
+    de dir_casos (caso1.txt, caso2.txt, ...). Opções "--nome=valor"
+    são ignoradas aqui (ver opcao_da_linha_de_comando).
+    """
+    caminhos = [a for a in sys.argv[1:] if not a.startswith("--")]
+    if caminhos:
+        return caminhos
+
+    nomes = [n for n in os.listdir(dir_casos) if n.startswith("caso") and n.endswith(".txt")]
+    nomes.sort(key=lambda n: int(n[4:-4]))
+    return [os.path.join(dir_casos, n) for n in nomes]
+
+
+def opcao_da_linha_de_comando(nome, padrao):
+    """
+    Valor de "--nome=valor" na linha de comando, convertido para o tipo do
+    padrão; devolve o padrão se a opção não foi passada.
+    """
+    prefixo = f"--{nome}="
+    for argumento in sys.argv[1:]:
+        if argumento.startswith(prefixo):
+            return type(padrao)(argumento[len(prefixo):])
+    return padrao
+
+
+def dividir(numeros, indices):
+    """
+    Separa os números em (conjunto_a, conjunto_b): os de posição em
+    "indices" e os demais.
+    """
+    marcados = set(indices)
+    conjunto_a = [x for i, x in enumerate(numeros) if i in marcados]
+    conjunto_b = [x for i, x in enumerate(numeros) if i not in marcados]
+    return conjunto_a, conjunto_b
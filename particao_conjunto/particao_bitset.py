@@ -0,0 +1,108 @@
+# Partição de Conjunto por conjunto de bits num único inteiro Python
+# A PD clássica guarda uma tabela booleana (n + 1) × (alvo + 1); no caso5
+# (100 números de 100.000 a 199.000, alvo ≈ 7,5 milhões) isso passa de
+# vários GB. As somas alcançáveis cabem num único inteiro de alvo + 1 bits:
+# o bit s vale 1 se algum subconjunto soma s, e cada número é UM deslocamento
+# "bits |= bits << x", feito em C sobre palavras de 64 bits.
+#
+# Uso: python particao_bitset.py [caso.txt ...]
+
+import math
+import time
+
+from particao import casos_da_linha_de_comando, dividir, ler_caso
+
+
+def _reconstruir(numeros, pontos, passo, fim, soma, mascara):
+    """
+    Índices de um subconjunto de numeros[:fim] que soma "soma".
+
+    Explicação:
+    - pontos[c] guarda o conjunto de bits ANTES do número c·passo; os
+      demais são recalculados a partir do ponto de controle do trecho.
+    - De trás para frente: se a soma já era alcançável antes do número i,
+      ele fica de fora; senão ele entra e a soma cai x_i.
+    - Só um trecho de "passo" conjuntos de bits fica vivo por vez.
+    """
+    escolhidos = []
+    for inicio in reversed(range(0, fim, passo)):
+        termino = min(inicio + passo, fim)
+        bits = pontos[inicio // passo]
+        camadas = [bits]
+        for i in range(inicio, termino - 1):
+            bits = (bits | bits << numeros[i]) & mascara
+            camadas.append(bits)
+
+        for i in reversed(range(inicio, termino)):
+            if not camadas[i - inicio] >> soma & 1:
+                escolhidos.append(i)
+                soma -= numeros[i]
+
+    escolhidos.reverse()
+    return escolhidos
+
+
+def particao_bitset(numeros):
+    """
+    Melhor partição de números inteiros não negativos em dois conjuntos.
+
+    Explicação:
+    - alvo = soma // 2; os bits acima do alvo são descartados (máscara),
+      então cada conjunto de bits tem alvo + 1 bits.
+    - Parada antecipada: quando o bit do alvo acende, a partição perfeita
+      (ou, com soma ímpar, a de diferença 1) já foi encontrada e os
+      números restantes vão todos para o outro conjunto.
+    - Sem parada, a melhor soma é o bit mais alto do conjunto final.
+    - Reconstrução com pontos de controle a cada ~√n números: memória
+      O(√n · alvo) bits em vez de O(n · alvo).
+    - Devolve (diferenca, conjunto_a, conjunto_b).
+    """
+    total = sum(numeros)
+    alvo = total // 2
+    mascara = (1 << (alvo + 1)) - 1
+    passo = math.isqrt(len(numeros)) + 1
+
+    bits = 1
+    pontos = []
+    fim = len(numeros)
+    for i, x in enumerate(numeros):
+        if i % passo == 0:
+            pontos.append(bits)
+        bits = (bits | bits << x) & mascara
+        if bits >> alvo & 1:
+            fim = i + 1
+            break
+
+    melhor = bits.bit_length() - 1
+    indices = _reconstruir(numeros, pontos, passo, fim, melhor, mascara)
+    conjunto_a, conjunto_b = dividir(numeros, indices)
+
+    return total - 2 * melhor, conjunto_a, conjunto_b
+
+
+def main():
+    print("Partição de Conjunto — conjunto de bits\n")
+    print("=" * 60)
+
+    for caminho in casos_da_linha_de_comando():
+        numeros = ler_caso(caminho)
+
+        inicio = time.perf_counter()
+        diferenca, conjunto_a, conjunto_b = particao_bitset(numeros)
+        tempo_ms = (time.perf_counter() - inicio) * 1000
+
+        print(f"✓ {caminho}")
+        print(f"  n={len(numeros)}, soma={sum(numeros):,}, alvo={sum(numeros) // 2:,}")
+        print(f"  diferença={diferenca:,} ({'perfeita' if diferenca == 0 else 'sem partição perfeita'})")
+        print(f"  conjunto A ({len(conjunto_a)} números, soma {sum(conjunto_a):,}): {conjunto_a[:10]}"
+              f"{' ...' if len(conjunto_a) > 10 else ''}")
+        print(f"  conjunto B ({len(conjunto_b)} números, soma {sum(conjunto_b):,}): {conjunto_b[:10]}"
+              f"{' ...' if len(conjunto_b) > 10 else ''}")
+        print(f"  conjunto de bits={(sum(numeros) // 2 + 1) / 8 / 1024:,.1f} KB, tempo={tempo_ms:.2f} ms")
+        print()
+
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+# Partição de Conjunto por diferenciação (Karmarkar–Karp) e Complete-KK
+# Quando os números passam de 10^9, nenhuma tabela indexada pela soma cabe
+# na memória. O método da maior diferença (KK) troca os dois maiores números
+# pela sua diferença — "ficam em conjuntos opostos" — até sobrar um, em
+# O(n log n), com resíduo muito menor que o do guloso "maior no conjunto mais
+# leve". O Complete-KK (Korf) também tenta a SOMA — "ficam no mesmo conjunto"
+# — e vira uma busca exata que melhora a resposta do KK enquanto houver tempo.
+#
+# Uso: python particao_kk.py [--tempo=10] [--aleatorio=0] [caso.txt ...]
+#      --aleatorio=N inclui um caso com N números aleatórios até 10^12.
+
+import heapq
+import random
+import time
+from bisect import insort
+from itertools import count
+
+from particao import casos_da_linha_de_comando, dividir, ler_caso, opcao_da_linha_de_comando
+
+# Como cada número da lista atual foi formado a partir dos originais:
+#   (_FOLHA, i)          número original de índice i
+#   (_DIFERENCA, a, b)   a − b: a e b em conjuntos opostos (a >= b)
+#   (_SOMA, a, b)        a + b: a e b no mesmo conjunto
+_FOLHA, _DIFERENCA, _SOMA = 0, 1, 2
+
+
+def _lado_a(origem):
+    """
+    Índices do conjunto A a partir da origem do último número.
+
+    Explicação:
+    - O último número fica no conjunto A; uma diferença manda o menor
+      operando para o conjunto oposto, uma soma mantém os dois juntos.
+    - Pilha explícita: a árvore tem profundidade até n.
+    """
+    indices = []
+    pilha = [(origem, True)]
+    while pilha:
+        no, em_a = pilha.pop()
+        if no[0] == _FOLHA:
+            if em_a:
+                indices.append(no[1])
+        else:
+            pilha.append((no[1], em_a))
+            pilha.append((no[2], em_a if no[0] == _SOMA else not em_a))
+    return indices
+
+
+def karmarkar_karp(numeros):
+    """
+    Heurística da maior diferença (Karmarkar–Karp).
+
+    Explicação:
+    - Heap de máximo com os números; a cada passo os dois maiores a >= b
+      saem e a − b entra (a e b ficam em conjuntos opostos).
+    - O número que sobra é a diferença entre os conjuntos.
+    - Tempo O(n log n).
+    - Devolve (diferenca, conjunto_a, conjunto_b).
+    """
+    if not numeros:
+        return 0, [], []
+
+    ordem = count()
+    heap = [(-x, next(ordem), (_FOLHA, i)) for i, x in enumerate(numeros)]
+    heapq.heapify(heap)
+
+    while len(heap) > 1:
+        a, _, origem_a = heapq.heappop(heap)
+        b, _, origem_b = heapq.heappop(heap)
+        heapq.heappush(heap, (a - b, next(ordem), (_DIFERENCA, origem_a, origem_b)))
+
+    diferenca, _, origem = heap[0]
+    conjunto_a, conjunto_b = dividir(numeros, _lado_a(origem))
+    return -diferenca, conjunto_a, conjunto_b
+
+
+def particao_ckk(numeros, tempo_limite=None, max_nos=None):
+    """
+    Complete Karmarkar–Karp: busca exata "a qualquer momento".
+
+    Explicação:
+    - Cada nó é uma lista ordenada de números; os dois maiores a >= b são
+      trocados por a − b (primeiro ramo, o do KK) ou por a + b.
+    - Busca em profundidade, diferença primeiro: a primeira folha é a
+      resposta do KK e as seguintes só a melhoram.
+    - Folha: quando o maior número é >= soma dos demais, o melhor possível
+      daquele nó é pôr todos os demais contra ele (diferença 2·maior − soma).
+    - Toda lista tem a mesma paridade da soma original, então nenhuma
+      diferença fica abaixo de soma % 2: ao encontrá-la (partição
+      perfeita) a busca termina.
+    - tempo_limite (segundos) e max_nos interrompem a busca; a melhor
+      partição encontrada até ali é devolvida com otimo=False.
+    - Devolve (diferenca, conjunto_a, conjunto_b, otimo, nos_visitados).
+    """
+    if not numeros:
+        return 0, [], [], True, 0
+
+    inicio = time.perf_counter()
+    total = sum(numeros)
+    perfeita = total % 2
+    ordem = count()
+
+    raiz = sorted((x, next(ordem), (_FOLHA, i)) for i, x in enumerate(numeros))
+    melhor_diferenca, melhor_origem = None, None
+    nos_visitados = 0
+    otimo = True
+
+    # Nó: (lista crescente de (valor, desempate, origem), soma da lista).
+    pilha = [(raiz, total)]
+    while pilha:
+        if melhor_diferenca == perfeita:
+            break
+        if max_nos is not None and nos_visitados >= max_nos:
+            otimo = False
+            break
+        if tempo_limite is not None and nos_visitados % 1024 == 0:
+            if time.perf_counter() - inicio > tempo_limite:
+                otimo = False
+                break
+
+        lista, soma = pilha.pop()
+        nos_visitados += 1
+
+        maior, _, origem_maior = lista[-1]
+        if 2 * maior >= soma:
+            diferenca = 2 * maior - soma
+            if melhor_diferenca is None or diferenca < melhor_diferenca:
+                melhor_diferenca = diferenca
+                melhor_origem = _folha_dominante(lista)
+            continue
+
+        b, _, origem_b = lista[-2]
+        resto = lista[:-2]
+
+        com_soma = resto[:]
+        insort(com_soma, (maior + b, next(ordem), (_SOMA, origem_maior, origem_b)))
+        com_diferenca = resto
+        insort(com_diferenca, (maior - b, next(ordem), (_DIFERENCA, origem_maior, origem_b)))
+
+        # O último empilhado (diferença, o ramo do KK) é expandido primeiro.
+        pilha.append((com_soma, soma))
+        pilha.append((com_diferenca, soma - 2 * b))
+
+    conjunto_a, conjunto_b = dividir(numeros, _lado_a(melhor_origem))
+    return melhor_diferenca, conjunto_a, conjunto_b, otimo, nos_visitados
+
+
+def _folha_dominante(lista):
+    """
+    Origem da folha em que o maior número fica sozinho contra a soma dos
+    demais: (maior) − (soma do resto).
+    """
+    _, _, origem_maior = lista[-1]
+    if len(lista) == 1:
+        return origem_maior
+
+    resto = lista[0][2]
+    for _, _, origem in lista[1:-1]:
+        resto = (_SOMA, origem, resto)
+    return (_DIFERENCA, origem_maior, resto)
+
+
+def _diferenca_gulosa(numeros):
+    """Guloso do material: em ordem decrescente, cada número vai para o conjunto mais leve."""
+    leve = pesado = 0
+    for x in sorted(numeros, reverse=True):
+        leve += x
+        if leve > pesado:
+            leve, pesado = pesado, leve
+    return pesado - leve
+
+
+def main():
+    tempo_limite = opcao_da_linha_de_comando("tempo", 10.0)
+    aleatorio = opcao_da_linha_de_comando("aleatorio", 0)
+
+    casos = [(caminho, ler_caso(caminho)) for caminho in casos_da_linha_de_comando()]
+    if aleatorio:
+        gerador = random.Random(0)
+        casos.append((f"aleatório (n={aleatorio}, até 10^12)", [gerador.randint(1, 10**12) for _ in range(aleatorio)]))
+
+    print("Partição de Conjunto — Karmarkar–Karp e Complete-KK\n")
+    print("=" * 60)
+
+    for nome, numeros in casos:
+        inicio = time.perf_counter()
+        diferenca_kk, _, _ = karmarkar_karp(numeros)
+        tempo_kk = (time.perf_counter() - inicio) * 1000
+
+        inicio = time.perf_counter()
+        diferenca, conjunto_a, conjunto_b, otimo, nos = particao_ckk(numeros, tempo_limite)
+        tempo_ckk = (time.perf_counter() - inicio) * 1000
+
+        print(f"✓ {nome}")
+        print(f"  n={len(numeros)}, soma={sum(numeros):,}")
+        print(f"  guloso: diferença={_diferenca_gulosa(numeros):,}")
+        print(f"  KK:     diferença={diferenca_kk:,}, {tempo_kk:.2f} ms")
+        print(f"  CKK:    diferença={diferenca:,} ({'ótima' if otimo else 'melhor encontrada'}), "
+              f"{nos:,} nós, {tempo_ckk:.2f} ms")
+        print(f"  conjunto A ({len(conjunto_a)} números, soma {sum(conjunto_a):,}), "
+              f"conjunto B ({len(conjunto_b)} números, soma {sum(conjunto_b):,})")
+        print()
+
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
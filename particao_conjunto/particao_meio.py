@@ -0,0 +1,216 @@
+# Partição de Conjunto por encontro no meio (Horowitz–Sahni e Schroeppel–Shamir)
+# Com poucos números (n até ~50) mas valores enormes, a tabela indexada pela
+# soma não existe, mas 2^(n/2) somas de meio conjunto cabem na memória: cada
+# metade enumera todas as suas somas e a melhor combinação sai de uma busca
+# ordenada. O tempo depende só de n, nunca da magnitude dos números: com
+# n = 50 (caso4) o Schroeppel–Shamir leva ~2 minutos em Python puro.
+#
+# Uso: python particao_meio.py [--modo=auto|hs|ss] [--max_n=50] [--aleatorio=0]
+#                              [caso.txt ...]
+#      --aleatorio=N inclui um caso com N números aleatórios até 10^12.
+
+import heapq
+import random
+import time
+
+import numpy as np
+
+from particao import casos_da_linha_de_comando, dividir, ler_caso, opcao_da_linha_de_comando
+
+# Acima deste n o modo automático troca Horowitz–Sahni (memória O(2^(n/2)))
+# por Schroeppel–Shamir (memória O(2^(n/4))).
+N_MAXIMO_HS = 44
+
+# Casos maiores que este n são ignorados por padrão (--max_n): o
+# Schroeppel–Shamir percorre 2^(n/2) somas, ~33 milhões com n = 50.
+N_MAXIMO_SS = 50
+
+
+def _tipo_das_somas(numeros):
+    """int64 se 2·soma total cabe nele; senão inteiros Python (object)."""
+    return np.int64 if 2 * sum(numeros) < 2**62 else object
+
+
+def _somas_e_mascaras(numeros, inicio, tipo):
+    """
+    Todas as 2^k somas de subconjuntos e as máscaras de bits que as formam.
+
+    Explicação:
+    - Cada número dobra os vetores: as somas sem ele e as somas com ele.
+    - O bit (inicio + i) da máscara marca numeros[i] (índice original).
+    - tipo: int64 quando as somas cabem, object (inteiros Python) acima.
+    """
+    somas = np.zeros(1, dtype=tipo)
+    mascaras = np.zeros(1, dtype=object if inicio + len(numeros) > 62 else np.int64)
+    for i, x in enumerate(numeros):
+        somas = np.concatenate((somas, somas + x))
+        mascaras = np.concatenate((mascaras, mascaras | (1 << (inicio + i))))
+    return somas, mascaras
+
+
+def _indices(mascara):
+    return [i for i in range(int(mascara).bit_length()) if int(mascara) >> i & 1]
+
+
+def particao_horowitz_sahni(numeros):
+    """
+    Encontro no meio: somas de cada metade, ordenação e busca binária.
+
+    Explicação:
+    - As 2^(n/2) somas da segunda metade são ordenadas.
+    - Para cada soma s da primeira metade, a melhor parceira está ao redor
+      de alvo − s (searchsorted, vetorizado para todas as somas de uma vez):
+      basta olhar a vizinha de cada lado.
+    - Tempo O(2^(n/2) · n), memória O(2^(n/2)).
+    - Devolve (diferenca, conjunto_a, conjunto_b).
+    """
+    total = sum(numeros)
+    meio = len(numeros) // 2
+    tipo = _tipo_das_somas(numeros)
+    somas1, mascaras1 = _somas_e_mascaras(numeros[:meio], 0, tipo)
+    somas2, mascaras2 = _somas_e_mascaras(numeros[meio:], meio, tipo)
+
+    ordem = np.argsort(somas2, kind="stable")
+    somas2, mascaras2 = somas2[ordem], mascaras2[ordem]
+
+    posicao = np.searchsorted(somas2, total // 2 - somas1)
+    melhor_diferenca, melhor_mascara = None, 0
+    for vizinha in (posicao - 1, posicao):
+        vizinha = np.clip(vizinha, 0, len(somas2) - 1)
+        diferencas = np.abs(total - 2 * (somas1 + somas2[vizinha]))
+        k = int(np.argmin(diferencas))
+        if melhor_diferenca is None or diferencas[k] < melhor_diferenca:
+            melhor_diferenca = int(diferencas[k])
+            melhor_mascara = int(mascaras1[k]) | int(mascaras2[vizinha[k]])
+
+    conjunto_a, conjunto_b = dividir(numeros, _indices(melhor_mascara))
+    return melhor_diferenca, conjunto_a, conjunto_b
+
+
+def _somas_em_ordem(quarto1, quarto2, crescente):
+    """
+    Gera (soma, mascara) de todos os pares de dois quartos, em ordem.
+
+    Explicação:
+    - Os quartos vêm ordenados; o heap guarda, para cada soma do primeiro
+      quarto, o próximo parceiro ainda não gerado do segundo.
+    - Memória O(2^(n/4)): só o heap e os dois quartos existem.
+    """
+    (somas1, mascaras1), (somas2, mascaras2) = quarto1, quarto2
+    sinal = 1 if crescente else -1
+    heap = [(sinal * (s + somas2[0]), i, 0) for i, s in enumerate(somas1)]
+    heapq.heapify(heap)
+
+    while heap:
+        chave, i, j = heapq.heappop(heap)
+        yield sinal * chave, mascaras1[i] | mascaras2[j]
+        if j + 1 < len(somas2):
+            heapq.heappush(heap, (sinal * (somas1[i] + somas2[j + 1]), i, j + 1))
+
+
+def particao_schroeppel_shamir(numeros):
+    """
+    Encontro no meio com memória O(2^(n/4)) (Schroeppel–Shamir).
+
+    Explicação:
+    - Os números viram quatro quartos A, B, C, D, cada um com suas
+      2^(n/4) somas ordenadas.
+    - As somas a + b saem em ordem crescente e as c + d em ordem
+      decrescente, cada sequência gerada por um heap, sem nunca
+      materializar as 2^(n/2) somas.
+    - Dois ponteiros: se a soma atual fica abaixo da metade, avança a
+      sequência crescente; senão, a decrescente.
+    - Tempo O(2^(n/2) · log), parando ao achar a partição perfeita.
+    - Devolve (diferenca, conjunto_a, conjunto_b).
+    """
+    total = sum(numeros)
+    n = len(numeros)
+    cortes = [0, n // 4, n // 2, 3 * n // 4, n]
+
+    tipo = _tipo_das_somas(numeros)
+    quartos = []
+    for inicio, fim in zip(cortes, cortes[1:]):
+        somas, mascaras = _somas_e_mascaras(numeros[inicio:fim], inicio, tipo)
+        ordem = np.argsort(somas, kind="stable")
+        quartos.append(([int(s) for s in somas[ordem]], [int(m) for m in mascaras[ordem]]))
+
+    def descendente(quarto):
+        somas, mascaras = quarto
+        return somas[::-1], mascaras[::-1]
+
+    esquerda = _somas_em_ordem(quartos[0], quartos[1], crescente=True)
+    direita = _somas_em_ordem(descendente(quartos[2]), descendente(quartos[3]), crescente=False)
+
+    perfeita = total % 2
+    melhor_diferenca, melhor_mascara = None, 0
+    soma_e, mascara_e = next(esquerda)
+    soma_d, mascara_d = next(direita)
+    try:
+        while True:
+            dobro = 2 * (soma_e + soma_d)
+            diferenca = abs(total - dobro)
+            if melhor_diferenca is None or diferenca < melhor_diferenca:
+                melhor_diferenca, melhor_mascara = diferenca, mascara_e | mascara_d
+                if diferenca == perfeita:
+                    break
+            if dobro < total:
+                soma_e, mascara_e = next(esquerda)
+            else:
+                soma_d, mascara_d = next(direita)
+    except StopIteration:
+        pass
+
+    conjunto_a, conjunto_b = dividir(numeros, _indices(melhor_mascara))
+    return melhor_diferenca, conjunto_a, conjunto_b
+
+
+def particao_meio(numeros, modo="auto"):
+    """Horowitz–Sahni até N_MAXIMO_HS números, Schroeppel–Shamir acima (modo="auto")."""
+    if modo == "auto":
+        modo = "hs" if len(numeros) <= N_MAXIMO_HS else "ss"
+    if modo == "hs":
+        return particao_horowitz_sahni(numeros)
+    if modo == "ss":
+        return particao_schroeppel_shamir(numeros)
+    raise ValueError(f"modo desconhecido: {modo}")
+
+
+def main():
+    modo = opcao_da_linha_de_comando("modo", "auto")
+    max_n = opcao_da_linha_de_comando("max_n", N_MAXIMO_SS)
+    aleatorio = opcao_da_linha_de_comando("aleatorio", 0)
+
+    casos = [(caminho, ler_caso(caminho)) for caminho in casos_da_linha_de_comando()]
+    if aleatorio:
+        gerador = random.Random(0)
+        casos.append((f"aleatório (n={aleatorio}, até 10^12)", [gerador.randint(1, 10**12) for _ in range(aleatorio)]))
+
+    print(f"Partição de Conjunto — encontro no meio ({modo})\n")
+    print("=" * 60)
+
+    for nome, numeros in casos:
+        print(f"✓ {nome}")
+        if len(numeros) > max_n:
+            print(f"  n={len(numeros)} > {max_n}: 2^(n/2) somas demais, caso ignorado "
+                  f"(--modo=ss --max_n={len(numeros)} para rodar mesmo assim)")
+            print()
+            continue
+
+        inicio = time.perf_counter()
+        diferenca, conjunto_a, conjunto_b = particao_meio(numeros, modo)
+        tempo_ms = (time.perf_counter() - inicio) * 1000
+
+        print(f"  n={len(numeros)}, soma={sum(numeros):,}")
+        print(f"  diferença={diferenca:,}")
+        print(f"  conjunto A ({len(conjunto_a)} números, soma {sum(conjunto_a):,}): {conjunto_a[:8]}"
+              f"{' ...' if len(conjunto_a) > 8 else ''}")
+        print(f"  conjunto B ({len(conjunto_b)} números, soma {sum(conjunto_b):,}): {conjunto_b[:8]}"
+              f"{' ...' if len(conjunto_b) > 8 else ''}")
+        print(f"  tempo={tempo_ms:.2f} ms")
+        print()
+
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
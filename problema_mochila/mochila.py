@@ -0,0 +1,117 @@
+# Funções comuns aos algoritmos de Mochila
+# Leitura dos casos de teste no formato escrito por casos_teste/gerar_casos.py:
+#
+#   capacidade
+#   n_itens
+#   valor peso      (uma linha por item)
+
+import os
+import sys
+from functools import reduce
+from math import gcd
+
+DIR_CASOS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "casos_teste")
+
+
+def ler_caso(caminho):
+    """
+    Lê um arquivo de caso e devolve (capacidade, itens).
+
+    Explicação:
+    - A primeira linha é a capacidade e a segunda a quantidade de itens.
+    - Cada linha seguinte tem "valor peso".
+    - Os itens são devolvidos como lista de tuplas (valor, peso), na mesma
+      ordem do arquivo — o índice na lista identifica o item nas respostas.
+    """
+    with open(caminho) as f:
+        capacidade = int(f.readline())
+        n_itens = int(f.readline())
+        itens = []
+        for _ in range(n_itens):
+            valor, peso = map(int, f.readline().split())
+            itens.append((valor, peso))
+
+    return capacidade, itens
+
+
+def casos_da_linha_de_comando():
+    """
+    Caminhos passados na linha de comando ou, se nenhum, todos os casos
+    de casos_teste/ (caso1.txt, caso2.txt, ...). Opções "--nome=valor"
+    são ignoradas aqui (ver opcao_da_linha_de_comando).
+    """
+    caminhos = [a for a in sys.argv[1:] if not a.startswith("--")]
+    if caminhos:
+        return caminhos
+
+    nomes = [n for n in os.listdir(DIR_CASOS) if n.startswith("caso") and n.endswith(".txt")]
+    nomes.sort(key=lambda n: int(n[4:-4]))
+    return [os.path.join(DIR_CASOS, n) for n in nomes]
+
+
+def opcao_da_linha_de_comando(nome, padrao):
+    """
+    Valor de "--nome=valor" na linha de comando, convertido para o tipo do
+    padrão; devolve o padrão se a opção não foi passada.
+    """
+    prefixo = f"--{nome}="
+    for argumento in sys.argv[1:]:
+        if argumento.startswith(prefixo):
+            return type(padrao)(argumento[len(prefixo):])
+    return padrao
+
+
+def reduzir_por_mdc(capacidade, itens):
+    """
+    Divide todos os pesos e a capacidade pelo MDC dos pesos.
+
+    Explicação:
+    - Qualquer soma de pesos é múltipla de g = mdc(pesos).
+    - Logo, uma capacidade W equivale a uma capacidade floor(W / g) na escala
+      reduzida: nenhuma combinação de itens "perde" espaço com o arredondamento.
+    - Em caso3 e caso4 todos os pesos são múltiplos de 5 ou 50, então a escala
+      da capacidade cai na mesma proporção.
+    - Devolve (capacidade_reduzida, itens_reduzidos, g).
+    """
+    g = reduce(gcd, (peso for _, peso in itens), 0)
+    if g <= 1:
+        return capacidade, list(itens), 1
+
+    itens_reduzidos = [(valor, peso // g) for valor, peso in itens]
+    return capacidade // g, itens_reduzidos, g
+
+
+def mochila_fracionaria(capacidade, itens):
+    """
+    Mochila Fracionária — algoritmo guloso.
+
+    Explicação:
+    - Decisão gananciosa: pegar primeiro os itens de maior razão valor/peso.
+    - Cada item é levado inteiro enquanto couber; o primeiro que não couber é
+      levado pela fração que preenche o espaço restante e o algoritmo para.
+    - É ótimo para a versão fracionária e, por isso, seu valor é um LIMITE
+      SUPERIOR (relaxação linear) para a Mochila 0/1 com os mesmos itens.
+    - Devolve (valor_total, fracoes), com fracoes[i] em [0, 1] por item.
+    """
+    ordem = sorted(
+        range(len(itens)),
+        key=lambda i: itens[i][0] / itens[i][1] if itens[i][1] else float("inf"),
+        reverse=True,
+    )
+
+    fracoes = [0.0] * len(itens)
+    restante = capacidade
+    valor_total = 0.0
+
+    for i in ordem:
+        valor, peso = itens[i]
+        if peso <= restante:
+            fracoes[i] = 1.0
+            restante -= peso
+            valor_total += valor
+        else:
+            fracoes[i] = restante / peso
+            valor_total += valor * fracoes[i]
+            break
+
+    return valor_total, fracoes
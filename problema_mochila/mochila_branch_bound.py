@@ -0,0 +1,149 @@
+# Mochila 0/1 por Branch-and-Bound
+# Combina as duas abordagens do material: a Mochila Fracionária (gulosa) deixa
+# de ser "rival" da PD e passa a ser o LIMITE SUPERIOR de cada nó da busca.
+# A memória depende só de n e do número de nós abertos, nunca da capacidade W.
+#
+# Uso: python mochila_branch_bound.py [caso.txt ...]
+
+import heapq
+import time
+from bisect import bisect_right
+from itertools import count
+
+from mochila import casos_da_linha_de_comando, ler_caso, mochila_fracionaria
+
+
+def mochila_branch_bound(capacidade, itens, max_nos=None, tempo_limite=None, limite_mergulho=10000):
+    """
+    Branch-and-Bound exato para a Mochila 0/1.
+
+    Explicação:
+    - Os itens são ordenados por razão valor/peso decrescente.
+    - Em cada nó (nível, peso usado, valor), o limite superior é o valor da
+      Mochila Fracionária sobre os itens restantes. Com somas de prefixo e
+      busca binária ele sai em O(log n), sem refazer o guloso do zero.
+    - Um nó cujo limite não supera a melhor solução conhecida é podado.
+    - A busca começa em profundidade (pega o item primeiro), o que encontra
+      boas soluções cedo. Se passar limite_mergulho nós sem melhorar, os nós
+      abertos vão para um heap e a busca continua pela MELHOR PRIMEIRO
+      (maior limite), que fecha a diferença até o ótimo mais rápido.
+    - max_nos e tempo_limite (segundos) interrompem a busca; nesse caso a
+      melhor solução encontrada até ali é devolvida com otimo=False.
+    - Devolve (valor, indices_escolhidos, otimo, nos_visitados).
+    """
+    inicio = time.perf_counter()
+
+    candidatos = [i for i, (valor, peso) in enumerate(itens) if valor > 0 and peso <= capacidade]
+    candidatos.sort(
+        key=lambda i: itens[i][0] / itens[i][1] if itens[i][1] else float("inf"),
+        reverse=True,
+    )
+    valores = [itens[i][0] for i in candidatos]
+    pesos = [itens[i][1] for i in candidatos]
+    n = len(candidatos)
+
+    # Somas de prefixo na ordem da razão: soma_pesos[i] = pesos[0] + ... + pesos[i-1]
+    soma_pesos = [0] * (n + 1)
+    soma_valores = [0] * (n + 1)
+    for i in range(n):
+        soma_pesos[i + 1] = soma_pesos[i] + pesos[i]
+        soma_valores[i + 1] = soma_valores[i] + valores[i]
+
+    def limite_superior(nivel, peso_usado, valor):
+        # Guloso fracionário a partir do item "nivel" com o espaço restante.
+        # O piso é exato porque todos os valores da Mochila 0/1 são inteiros.
+        alcance = soma_pesos[nivel] + capacidade - peso_usado
+        j = bisect_right(soma_pesos, alcance, nivel) - 1
+        limite = valor + soma_valores[j] - soma_valores[nivel]
+        if j < n:
+            limite += (alcance - soma_pesos[j]) * valores[j] // pesos[j]
+        return limite
+
+    melhor_valor = 0
+    melhor_escolhas = None
+    nos_visitados = 0
+    otimo = True
+
+    # Nó: (nível, peso usado, valor, escolhas) — escolhas é a lista encadeada
+    # (posição na ordem, escolhas anteriores) dos itens levados.
+    pilha = [(0, 0, 0, None)]
+    heap = None
+    sem_melhora = 0
+    ordem = count()  # desempate no heap sem comparar as listas de escolhas
+
+    while pilha or heap:
+        if max_nos is not None and nos_visitados >= max_nos:
+            otimo = False
+            break
+        if tempo_limite is not None and nos_visitados % 1024 == 0:
+            if time.perf_counter() - inicio > tempo_limite:
+                otimo = False
+                break
+
+        if heap is None:
+            nivel, peso_usado, valor, escolhas = pilha.pop()
+        else:
+            _, _, (nivel, peso_usado, valor, escolhas) = heapq.heappop(heap)
+        nos_visitados += 1
+
+        if valor > melhor_valor:
+            melhor_valor = valor
+            melhor_escolhas = escolhas
+            sem_melhora = 0
+        else:
+            sem_melhora += 1
+
+        if nivel == n or limite_superior(nivel, peso_usado, valor) <= melhor_valor:
+            continue
+
+        filhos = [(nivel + 1, peso_usado, valor, escolhas)]
+        if peso_usado + pesos[nivel] <= capacidade:
+            filhos.append(
+                (nivel + 1, peso_usado + pesos[nivel], valor + valores[nivel], (nivel, escolhas))
+            )
+
+        if heap is None:
+            # O último empilhado (levar o item) é o próximo a ser expandido.
+            pilha.extend(filhos)
+            if sem_melhora >= limite_mergulho:
+                heap = [(-limite_superior(*no[:3]), next(ordem), no) for no in pilha]
+                heapq.heapify(heap)
+                pilha = []
+        else:
+            for no in filhos:
+                heapq.heappush(heap, (-limite_superior(*no[:3]), next(ordem), no))
+
+    escolhidos = []
+    while melhor_escolhas is not None:
+        posicao, melhor_escolhas = melhor_escolhas
+        escolhidos.append(candidatos[posicao])
+    escolhidos.sort()
+
+    return melhor_valor, escolhidos, otimo, nos_visitados
+
+
+def main():
+    print("Mochila 0/1 — Branch-and-Bound com limite guloso\n")
+    print("=" * 60)
+
+    for caminho in casos_da_linha_de_comando():
+        capacidade, itens = ler_caso(caminho)
+
+        inicio = time.perf_counter()
+        valor, escolhidos, otimo, nos = mochila_branch_bound(capacidade, itens, tempo_limite=10)
+        tempo_ms = (time.perf_counter() - inicio) * 1000
+        limite_guloso, _ = mochila_fracionaria(capacidade, itens)
+
+        print(f"✓ {caminho}")
+        print(f"  capacidade={capacidade:,}, itens={len(itens)}")
+        print(f"  valor={valor} ({'ótimo' if otimo else 'melhor encontrado'})")
+        print(f"  limite fracionário (guloso)={limite_guloso:.2f}")
+        print(f"  itens escolhidos={escolhidos}")
+        print(f"  nós visitados={nos}, {tempo_ms:.2f} ms")
+        print()
+
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+# Mochila 0/1 aproximada com garantia (FPTAS)
+# Para entradas como caso4 (capacidade enorme), a PD indexada por PESO é
+# inviável. A PD indexada por VALOR não depende de W; escalando os valores
+# por K = ε·vmax/n, ela roda em O(n³/ε) e garante pelo menos (1 − ε)·ótimo.
+#
+# Uso: python mochila_fptas.py [--epsilon=0.1] [caso.txt ...]
+
+import time
+
+from mochila import (
+    casos_da_linha_de_comando,
+    ler_caso,
+    mochila_fracionaria,
+    opcao_da_linha_de_comando,
+)
+
+
+def mochila_fptas(capacidade, itens, epsilon):
+    """
+    Esquema de aproximação totalmente polinomial para a Mochila 0/1.
+
+    Explicação:
+    - Itens que não cabem sozinhos são descartados; vmax é o maior valor
+      entre os restantes.
+    - Cada valor vira floor(v / K), com K = ε·vmax/n. Se K < 1 os valores já
+      são pequenos e usamos K = 1 (a resposta sai exata).
+    - PD por valor: menor_peso[p] = menor peso que atinge valor escalado p.
+      A soma dos valores escalados é no máximo n²/ε, daí O(n³/ε).
+    - A resposta é o maior p com menor_peso[p] <= capacidade. Cada item perde
+      menos de K no arredondamento, então a perda total é < n·K = ε·vmax
+      <= ε·ótimo.
+    - Devolve (valor, indices_escolhidos, limite_superior), onde
+      limite_superior = min(valor / (1 − ε), Mochila Fracionária) é um teto
+      comprovado para o ótimo.
+    """
+    if not 0 < epsilon < 1:
+        raise ValueError("epsilon deve estar em (0, 1)")
+
+    candidatos = [i for i, (valor, peso) in enumerate(itens) if valor > 0 and peso <= capacidade]
+    if not candidatos:
+        return 0, [], 0
+
+    n = len(candidatos)
+    vmax = max(itens[i][0] for i in candidatos)
+    k = max(1.0, epsilon * vmax / n)
+    escalados = [int(itens[i][0] // k) for i in candidatos]
+
+    total = sum(escalados)
+    infinito = capacidade + 1
+    menor_peso = [0] + [infinito] * total
+    # levou[j][p] = 1 se, ao processar o candidato j, valor p passou a usar j
+    levou = []
+
+    alcance = 0
+    for j, i in enumerate(candidatos):
+        valor_escalado = escalados[j]
+        peso = itens[i][1]
+        marcas = bytearray(total + 1)
+        alcance += valor_escalado
+
+        for p in range(alcance, valor_escalado - 1, -1):
+            novo = menor_peso[p - valor_escalado] + peso
+            if novo < menor_peso[p]:
+                menor_peso[p] = novo
+                marcas[p] = 1
+
+        levou.append(marcas)
+
+    p = max(p for p in range(total + 1) if menor_peso[p] <= capacidade)
+
+    escolhidos = []
+    for j in range(n - 1, -1, -1):
+        if levou[j][p]:
+            escolhidos.append(candidatos[j])
+            p -= escalados[j]
+    escolhidos.sort()
+
+    valor = sum(itens[i][0] for i in escolhidos)
+    limite_fracionario, _ = mochila_fracionaria(capacidade, [itens[i] for i in candidatos])
+    limite_superior = min(valor / (1 - epsilon), limite_fracionario)
+
+    return valor, escolhidos, limite_superior
+
+
+def main():
+    epsilon = opcao_da_linha_de_comando("epsilon", 0.1)
+
+    print(f"Mochila 0/1 — FPTAS (ε = {epsilon})\n")
+    print("=" * 60)
+
+    for caminho in casos_da_linha_de_comando():
+        capacidade, itens = ler_caso(caminho)
+
+        inicio = time.perf_counter()
+        valor, escolhidos, limite_superior = mochila_fptas(capacidade, itens, epsilon)
+        tempo_ms = (time.perf_counter() - inicio) * 1000
+        limite_guloso, _ = mochila_fracionaria(capacidade, itens)
+
+        print(f"✓ {caminho}")
+        print(f"  capacidade={capacidade:,}, itens={len(itens)}")
+        print(f"  valor aproximado={valor} (>= {1 - epsilon:.2f} × ótimo)")
+        print(f"  ótimo <= {limite_superior:.2f}")
+        print(f"  limite fracionário (guloso)={limite_guloso:.2f}")
+        print(f"  itens escolhidos={escolhidos}")
+        print(f"  tempo={tempo_ms:.2f} ms")
+        print()
+
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
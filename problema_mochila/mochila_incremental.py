@@ -0,0 +1,169 @@
+# Mochila 0/1 incremental (inserção e remoção de itens)
+# Quando a lista de itens muda pouco entre duas consultas, refazer a PD inteira
+# custa O(n·W). Guardando uma pilha de linhas (checkpoints), inserir um item
+# custa UMA camada da PD, O(W), e remover o item do topo custa O(1). Remover
+# um item mais fundo reaplica os que estão acima dele: no pior caso (o
+# primeiro item) é a PD inteira de novo.
+#
+# Uso: python mochila_incremental.py [caso.txt ...]
+
+import math
+import time
+
+import numpy as np
+
+from mochila import casos_da_linha_de_comando, ler_caso, reduzir_por_mdc
+from mochila_pd_numpy import aplicar_item
+
+
+class MochilaIncremental:
+    """
+    Mochila 0/1 com estado, sobre uma pilha de linhas da PD.
+
+    Explicação:
+    - pilha[k] é a linha da PD depois dos k primeiros itens da pilha;
+      pilha[0] é a linha só de zeros.
+    - adicionar(valor, peso): copia o topo e aplica uma camada → O(W).
+    - remover(id): se o item está no topo, basta desempilhar. Se está na
+      posição p, desempilhamos até ele e reaplicamos os n − p − 1 itens que
+      estavam acima: O((n − p)·W). Remover o primeiro item é O(n·W), o mesmo
+      que refazer a PD. Só quem remove na ordem inversa da inserção (o caso
+      comum "testa um item e desiste") paga O(1).
+    - Memória: uma linha de W / escala + 1 inteiros por item presente, ou
+      seja, a tabela (n + 1) × (W / escala + 1) inteira.
+    - "escala" é um divisor comum de todos os pesos presentes (em caso4,
+      50): as linhas ficam "escala" vezes menores. Um peso novo que não é
+      múltiplo dela troca a escala pelo MDC e refaz a pilha uma vez,
+      O(n·W / escala novo).
+    """
+
+    def __init__(self, capacidade, escala=1):
+        self.capacidade = capacidade
+        self.escala = escala
+        self._capacidade_interna = capacidade // escala
+        self._pilha = [np.zeros(self._capacidade_interna + 1, dtype=np.int64)]
+        self._itens = []  # (id, valor, peso), na ordem da pilha
+        self._proximo_id = 0
+
+    @classmethod
+    def de_caso(cls, caminho):
+        """
+        Cria a mochila a partir de um arquivo "capacidade / n / valor peso",
+        usando o MDC dos pesos do arquivo como escala.
+        """
+        capacidade, itens = ler_caso(caminho)
+        _, _, escala = reduzir_por_mdc(capacidade, itens)
+        mochila = cls(capacidade, escala)
+        for valor, peso in itens:
+            mochila.adicionar(valor, peso)
+        return mochila
+
+    def __len__(self):
+        return len(self._itens)
+
+    def _empilhar(self, id_item, valor, peso):
+        linha = self._pilha[-1].copy()
+        aplicar_item(linha, valor, peso // self.escala)
+        self._pilha.append(linha)
+        self._itens.append((id_item, valor, peso))
+
+    def _reescalar(self, escala):
+        """Troca a escala e recalcula todas as linhas da pilha com ela."""
+        itens = self._itens
+        self.escala = escala
+        self._capacidade_interna = self.capacidade // escala
+        self._pilha = [np.zeros(self._capacidade_interna + 1, dtype=np.int64)]
+        self._itens = []
+        for item in itens:
+            self._empilhar(*item)
+
+    def adicionar(self, valor, peso):
+        """
+        Insere um item e devolve o identificador usado para removê-lo.
+
+        Explicação:
+        - Se o peso não é múltiplo da escala atual, a escala passa a ser
+          mdc(escala, peso) e a pilha é recalculada antes da inserção.
+        """
+        if peso % self.escala:
+            self._reescalar(math.gcd(self.escala, peso))
+        id_item = self._proximo_id
+        self._proximo_id += 1
+        self._empilhar(id_item, valor, peso)
+        return id_item
+
+    def remover(self, id_item):
+        """Remove o item com esse identificador; KeyError se não existir."""
+        for posicao in range(len(self._itens) - 1, -1, -1):
+            if self._itens[posicao][0] == id_item:
+                break
+        else:
+            raise KeyError(id_item)
+
+        acima = self._itens[posicao + 1:]
+        del self._itens[posicao:]
+        del self._pilha[posicao + 1:]
+
+        for item in acima:
+            self._empilhar(*item)
+
+    def valor(self):
+        """Valor ótimo com os itens atuais."""
+        return int(self._pilha[-1][-1])
+
+    def escolhidos(self):
+        """
+        Identificadores dos itens da solução ótima atual.
+
+        Explicação:
+        - Descendo a pilha, o item k foi usado na capacidade c se a linha
+          mudou ao aplicá-lo: pilha[k][c] != pilha[k - 1][c].
+        - Nesse caso o item entra na resposta e c diminui do peso dele.
+        """
+        c = self._capacidade_interna
+        resposta = []
+        for k in range(len(self._itens), 0, -1):
+            if self._pilha[k][c] != self._pilha[k - 1][c]:
+                id_item, _, peso = self._itens[k - 1]
+                resposta.append(id_item)
+                c -= peso // self.escala
+        resposta.reverse()
+        return resposta
+
+
+def main():
+    print("Mochila 0/1 — incremental\n")
+    print("=" * 60)
+
+    for caminho in casos_da_linha_de_comando():
+        inicio = time.perf_counter()
+        mochila = MochilaIncremental.de_caso(caminho)
+        tempo_carga = (time.perf_counter() - inicio) * 1000
+
+        print(f"✓ {caminho}")
+        print(f"  capacidade={mochila.capacidade:,}, itens={len(mochila)}")
+        print(f"  valor ótimo={mochila.valor()}, escolhidos={mochila.escolhidos()}")
+        print(f"  carga inicial={tempo_carga:.2f} ms")
+
+        # Simula a mudança típica entre duas consultas: um item novo
+        # entra, é avaliado e sai; depois o primeiro item do arquivo sai
+        # (pior caso da remoção: todos os outros itens são reaplicados).
+        inicio = time.perf_counter()
+        novo = mochila.adicionar(1000, mochila.escala)
+        valor_com_novo = mochila.valor()
+        mochila.remover(novo)
+        tempo_topo = (time.perf_counter() - inicio) * 1000
+        print(f"  + item (1000, {mochila.escala}) → valor={valor_com_novo}; removido em {tempo_topo:.2f} ms")
+
+        if len(mochila):
+            inicio = time.perf_counter()
+            mochila.remover(0)
+            tempo_base = (time.perf_counter() - inicio) * 1000
+            print(f"  - item 0 (pior caso) → valor={mochila.valor()}, em {tempo_base:.2f} ms")
+        print()
+
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+# Mochila 0/1 por fronteira de Pareto (estados esparsos)
+# Em vez da tabela (n_itens + 1) × (capacidade + 1), guardamos apenas os pares
+# (peso, valor) NÃO dominados. O custo passa a depender do número de estados
+# da fronteira, e não da capacidade W.
+#
+# Uso: python mochila_pareto.py [caso.txt ...]
+
+import time
+
+from mochila import casos_da_linha_de_comando, ler_caso, reduzir_por_mdc
+
+
+def _mesclar_fronteiras(a, b):
+    """
+    Mescla duas fronteiras ordenadas por peso, descartando estados dominados.
+
+    Explicação:
+    - Um estado (peso, valor) é dominado se existe outro com peso <= e
+      valor >= ao dele.
+    - Percorrendo os dois vetores em ordem de (peso crescente, valor
+      decrescente), basta manter um estado se o valor dele for ESTRITAMENTE
+      maior que o último mantido.
+    - O resultado continua ordenado por peso e com valores crescentes.
+    """
+    resultado = []
+    i, j = 0, 0
+    len_a, len_b = len(a), len(b)
+
+    while i < len_a or j < len_b:
+        if j == len_b or (i < len_a and (a[i][0], -a[i][1]) <= (b[j][0], -b[j][1])):
+            estado = a[i]
+            i += 1
+        else:
+            estado = b[j]
+            j += 1
+
+        if not resultado or estado[1] > resultado[-1][1]:
+            resultado.append(estado)
+
+    return resultado
+
+
+def mochila_pareto(capacidade, itens):
+    """
+    Resolve a Mochila 0/1 mantendo só a fronteira de Pareto.
+
+    Explicação:
+    - Pesos e capacidade são divididos pelo MDC dos pesos (reduzir_por_mdc).
+    - Cada estado é (peso, valor, escolhas), onde "escolhas" é uma lista
+      encadeada imutável (indice_item, escolhas_anteriores). Estados que
+      compartilham o mesmo prefixo de decisões compartilham a memória.
+    - Para cada item, a fronteira atual é deslocada por (peso, valor) do item,
+      os estados que estouram a capacidade são descartados e as duas listas
+      são mescladas removendo os dominados.
+    - O último estado da fronteira é o de maior valor: é a resposta ótima.
+    - Complexidade: O(n · S), onde S é o maior tamanho da fronteira
+      (S <= capacidade + 1, mas tipicamente muito menor).
+    - Devolve (valor_otimo, indices_escolhidos, maior_fronteira).
+    """
+    capacidade, itens, _ = reduzir_por_mdc(capacidade, itens)
+
+    fronteira = [(0, 0, None)]
+    maior_fronteira = 1
+
+    for indice, (valor, peso) in enumerate(itens):
+        if peso > capacidade:
+            continue
+
+        limite = capacidade - peso
+        deslocada = [
+            (p + peso, v + valor, (indice, escolhas))
+            for p, v, escolhas in fronteira
+            if p <= limite
+        ]
+        fronteira = _mesclar_fronteiras(fronteira, deslocada)
+        maior_fronteira = max(maior_fronteira, len(fronteira))
+
+    _, valor_otimo, escolhas = fronteira[-1]
+
+    escolhidos = []
+    while escolhas is not None:
+        indice, escolhas = escolhas
+        escolhidos.append(indice)
+    escolhidos.reverse()
+
+    return valor_otimo, escolhidos, maior_fronteira
+
+
+def main():
+    print("Mochila 0/1 — fronteira de Pareto\n")
+    print("=" * 60)
+
+    for caminho in casos_da_linha_de_comando():
+        capacidade, itens = ler_caso(caminho)
+
+        inicio = time.perf_counter()
+        valor, escolhidos, maior_fronteira = mochila_pareto(capacidade, itens)
+        tempo_ms = (time.perf_counter() - inicio) * 1000
+
+        peso_total = sum(itens[i][1] for i in escolhidos)
+        print(f"✓ {caminho}")
+        print(f"  capacidade={capacidade:,}, itens={len(itens)}")
+        print(f"  valor ótimo={valor}, peso usado={peso_total:,}")
+        print(f"  itens escolhidos={escolhidos}")
+        print(f"  maior fronteira={maior_fronteira} estados, {tempo_ms:.2f} ms")
+        print()
+
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+# Mochila 0/1 por PD com uma única linha NumPy (memória O(W))
+# A PD de referência guarda a tabela (n_itens + 1) × (capacidade + 1) inteira só
+# para reconstruir os itens escolhidos. Aqui guardamos UMA linha int64 por vez
+# e recuperamos a escolha por divisão e conquista (estilo Hirschberg).
+#
+# Uso: python mochila_pd_numpy.py [caso.txt ...]
+
+import time
+
+import numpy as np
+
+from mochila import casos_da_linha_de_comando, ler_caso, reduzir_por_mdc
+
+
+def aplicar_item(linha, valor, peso):
+    """
+    Aplica UMA camada da PD (um item) sobre a linha, no próprio vetor.
+
+    Explicação:
+    - linha[w:] = max(linha[w:], linha[:-w] + v).
+    - O lado direito é calculado inteiro a partir da linha antiga antes da
+      atribuição, então o item é usado no máximo uma vez (0/1).
+    """
+    capacidade = len(linha) - 1
+    if peso > capacidade or valor <= 0:
+        return
+    if peso == 0:
+        linha += valor
+    else:
+        linha[peso:] = np.maximum(linha[peso:], linha[:-peso] + valor)
+
+
+def linha_pd(itens, capacidade):
+    """
+    Última linha da tabela da PD: melhor valor para cada capacidade 0..W.
+
+    Explicação:
+    - linha[c] = maior valor usando os itens dados com peso total <= c.
+    - Cada item é UMA operação vetorizada (aplicar_item); o laço interno
+      sobre as capacidades roda em C dentro do NumPy.
+    """
+    linha = np.zeros(capacidade + 1, dtype=np.int64)
+
+    for valor, peso in itens:
+        aplicar_item(linha, valor, peso)
+
+    return linha
+
+
+def _reconstruir(itens, indices, capacidade, escolhidos):
+    """
+    Divide os itens ao meio e descobre quanto da capacidade cada metade usa.
+
+    Explicação:
+    - f = linha_pd(primeira metade), g = linha_pd(segunda metade).
+    - O ótimo com capacidade W divide-se em c para a primeira metade e W - c
+      para a segunda, com c = argmax f[c] + g[W - c].
+    - Resolve cada metade recursivamente com sua fatia da capacidade.
+    - As capacidades de um mesmo nível somam no máximo W, então o trabalho
+      total é O(n·W) e só há O(W) de memória viva por nível.
+    """
+    if not indices:
+        return
+
+    if len(indices) == 1:
+        valor, peso = itens[indices[0]]
+        if peso <= capacidade and valor > 0:
+            escolhidos.append(indices[0])
+        return
+
+    meio = len(indices) // 2
+    esquerda, direita = indices[:meio], indices[meio:]
+
+    f = linha_pd([itens[i] for i in esquerda], capacidade)
+    g = linha_pd([itens[i] for i in direita], capacidade)
+    corte = int(np.argmax(f + g[::-1]))
+    del f, g
+
+    _reconstruir(itens, esquerda, corte, escolhidos)
+    _reconstruir(itens, direita, capacidade - corte, escolhidos)
+
+
+def mochila_pd_numpy(capacidade, itens):
+    """
+    Resolve a Mochila 0/1 com PD vetorizada em espaço linear.
+
+    Explicação:
+    - Pesos e capacidade são reduzidos pelo MDC dos pesos (caso3: W/5).
+    - O valor ótimo sai de uma passada de linha_pd.
+    - Os itens escolhidos saem da divisão e conquista em _reconstruir.
+    - Tempo O(n·W) (cerca do dobro da PD clássica), memória O(W) em vez de
+      O(n·W).
+    - Devolve (valor_otimo, indices_escolhidos).
+    """
+    capacidade, itens, _ = reduzir_por_mdc(capacidade, itens)
+
+    valor_otimo = int(linha_pd(itens, capacidade)[capacidade])
+
+    escolhidos = []
+    _reconstruir(itens, list(range(len(itens))), capacidade, escolhidos)
+    escolhidos.sort()
+
+    return valor_otimo, escolhidos
+
+
+def main():
+    print("Mochila 0/1 — PD NumPy em espaço linear\n")
+    print("=" * 60)
+
+    for caminho in casos_da_linha_de_comando():
+        capacidade, itens = ler_caso(caminho)
+
+        inicio = time.perf_counter()
+        valor, escolhidos = mochila_pd_numpy(capacidade, itens)
+        tempo_ms = (time.perf_counter() - inicio) * 1000
+        capacidade_reduzida, _, g = reduzir_por_mdc(capacidade, itens)
+
+        print(f"✓ {caminho}")
+        print(f"  capacidade={capacidade:,}, itens={len(itens)}")
+        print(f"  valor ótimo={valor}")
+        print(f"  itens escolhidos={escolhidos}")
+        print(f"  MDC dos pesos={g}, linha da PD={(capacidade_reduzida + 1) * 8 / 1024:.1f} KB")
+        print(f"  tempo={tempo_ms:.2f} ms")
+        print()
+
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
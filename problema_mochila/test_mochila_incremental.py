@@ -0,0 +1,43 @@
+import random
+
+from mochila_incremental import MochilaIncremental
+from mochila_pd_numpy import mochila_pd_numpy
+
+
+def _confere(mochila, itens_presentes):
+    valor, _ = mochila_pd_numpy(mochila.capacidade, list(itens_presentes.values()))
+    assert mochila.valor() == valor
+    escolhidos = mochila.escolhidos()
+    assert sum(itens_presentes[i][1] for i in escolhidos) <= mochila.capacidade
+    assert sum(itens_presentes[i][0] for i in escolhidos) == valor
+
+
+def test_peso_fora_do_mdc_do_caso(tmp_path):
+    # Mesmo padrão de caso4 (pesos múltiplos de 50), com capacidade menor.
+    caminho = tmp_path / "caso.txt"
+    caminho.write_text("1000\n3\n100 50\n180 100\n260 150\n")
+    mochila = MochilaIncremental.de_caso(str(caminho))
+    assert mochila.escala == 50
+
+    valor_antes = mochila.valor()
+    novo = mochila.adicionar(10, 7)
+    assert mochila.escala == 1
+    assert mochila.valor() >= valor_antes
+
+    mochila.remover(novo)
+    assert mochila.valor() == valor_antes
+
+
+def test_insercoes_e_remocoes_aleatorias():
+    gerador = random.Random(0)
+    mochila = MochilaIncremental(60, escala=6)
+    presentes = {}
+    for _ in range(200):
+        if presentes and gerador.random() < 0.4:
+            id_item = gerador.choice(list(presentes))
+            mochila.remover(id_item)
+            del presentes[id_item]
+        else:
+            item = (gerador.randint(0, 30), gerador.randint(0, 25))
+            presentes[mochila.adicionar(*item)] = item
+        _confere(mochila, presentes)